@@ -1,13 +1,14 @@
 import asyncio
 import html
 import logging
+import threading
 import traceback
 from datetime import timedelta
 from functools import partial
 from operator import add
-from typing import Iterable, Optional
+from typing import Dict, Iterable, Optional, Set
 
-from colorama import init
+from colorama import just_fix_windows_console
 from toolz import concat, pipe, unique
 from toolz.curried import filter, map
 
@@ -21,16 +22,16 @@ from ..messaging.messenger import process_message, validate
 from ..repository.data_models import ContextMessage
 from ..repository.goals.operations import create_onboarding_goal
 from ..repository.goals.queries import get_active_goals
-from ..repository.memory import get_active_memories
+from ..repository.memory import get_active_memories_for_listing
 from ..repository.message import (
     get_context_messages,
     get_time_since_most_recent_user_message,
     replace_context_messages,
 )
-from ..system_commands import SYSTEM_COMMANDS, contemplate
+from ..system_commands import SYSTEM_COMMAND_NAMES, contemplate
 from ..tools.user_preferences import get_user_preferred_name, set_user_preferred_name
 from ..utils.clock import get_utc_now
-from ..utils.utils import run_in_background_thread
+from ..utils.utils import queue_background_task, run_in_background_thread
 from .commands import invoke_system_command
 from .context import get_user_logged_in_message, periodic_context_refresh
 
@@ -52,7 +53,7 @@ def handle_message_stdio(ctx: ElroyContext, io: StdIO, message: str, tool: Optio
 
 
 async def run_chat(ctx: ElroyContext):
-    init(autoreset=True)
+    just_fix_windows_console()
     io = ctx.io
     assert isinstance(io, CliIO)
     run_in_background_thread(periodic_context_refresh, ctx)
@@ -86,25 +87,79 @@ async def run_chat(ctx: ElroyContext):
         )
 
     while True:
-        io.update_completer(get_active_goals(ctx), get_active_memories(ctx), context_messages)
+        io.update_completer(get_active_goals(ctx), get_active_memories_for_listing(ctx), context_messages)
 
         user_input = await io.prompt_user()
         if user_input.lower().startswith("/exit") or user_input == "exit":
             break
         elif user_input:
             await process_and_deliver_msg(USER, ctx, user_input)
-            run_in_background_thread(contemplate, ctx)
+            contemplate_in_background(ctx)
 
         io.rule()
         context_messages = get_context_messages(ctx)
         print_memory_panel(ctx, context_messages)
 
 
+# Per user, held while a background contemplation is running for that user
+CONTEMPLATE_LOCKS: Dict[int, threading.Lock] = {}
+CONTEMPLATE_LOCKS_GUARD = threading.Lock()
+
+# Users for whom a contemplation was requested while one was already running
+CONTEMPLATE_PENDING: Set[int] = set()
+
+
+def get_contemplate_lock(user_id: int) -> threading.Lock:
+    # Locks are never removed, so an existing one can be read without taking the guard. The guard only serializes creation.
+    lock = CONTEMPLATE_LOCKS.get(user_id)
+    if lock is None:
+        with CONTEMPLATE_LOCKS_GUARD:
+            lock = CONTEMPLATE_LOCKS.setdefault(user_id, threading.Lock())
+    return lock
+
+
+def contemplate_in_background(ctx: ElroyContext) -> None:
+    """
+    Starts a background contemplation, unless one is already running for the user. Requests made while one is running are
+    coalesced into a single follow-up contemplation, which starts once the running one finishes.
+    """
+    lock = get_contemplate_lock(ctx.user_id)
+
+    # The guard makes checking the lock and marking a follow-up atomic with the check made as a contemplation finishes
+    with CONTEMPLATE_LOCKS_GUARD:
+        if not lock.acquire(blocking=False):
+            logging.info("Contemplation already in progress, queueing a follow-up")
+            CONTEMPLATE_PENDING.add(ctx.user_id)
+            return
+
+    _queue_contemplation(ctx, lock)
+
+
+def _queue_contemplation(ctx: ElroyContext, lock: threading.Lock) -> None:
+    def _on_complete() -> None:
+        with CONTEMPLATE_LOCKS_GUARD:
+            follow_up = ctx.user_id in CONTEMPLATE_PENDING
+            CONTEMPLATE_PENDING.discard(ctx.user_id)
+            if not follow_up:
+                lock.release()
+
+        # The lock stays held for the follow-up, so no other contemplation starts in between
+        if follow_up:
+            _queue_contemplation(ctx, lock)
+
+    # The lock is released once the queued task finishes, including when its session fails to open
+    try:
+        queue_background_task(contemplate, ctx, on_complete=_on_complete)
+    except Exception:
+        lock.release()
+        raise
+
+
 async def process_and_deliver_msg(role: str, ctx: ElroyContext, user_input: str):
     if user_input.startswith("/") and role == USER:
         cmd = user_input[1:].split()[0]
 
-        if cmd.lower() not in {f.__name__ for f in SYSTEM_COMMANDS}:
+        if cmd.lower() not in SYSTEM_COMMAND_NAMES:
             ctx.io.sys_message(f"Unknown command: {cmd}")
         else:
             try:
@@ -113,7 +168,7 @@ async def process_and_deliver_msg(role: str, ctx: ElroyContext, user_input: str)
                     ctx.io.sys_message(str(result))
             except Exception as e:
                 pipe(
-                    traceback.format_exception(type(e), e, e.__traceback__),
+                    traceback.TracebackException.from_exception(e).format(),
                     "".join,
                     html.escape,
                     lambda x: x.replace("\n", "<br/>"),
@@ -127,9 +182,10 @@ async def process_and_deliver_msg(role: str, ctx: ElroyContext, user_input: str)
 def print_memory_panel(ctx: ElroyContext, context_messages: Iterable[ContextMessage]) -> None:
     io = ctx.io
     assert isinstance(io, CliIO)
+    min_created_at = get_utc_now() - ctx.max_in_context_message_age
     pipe(
         context_messages,
-        filter(lambda m: not m.created_at or m.created_at > get_utc_now() - ctx.max_in_context_message_age),
+        filter(lambda m: not m.created_at or m.created_at > min_created_at),
         map(lambda m: m.memory_metadata),
         filter(lambda m: m is not None),
         concat,
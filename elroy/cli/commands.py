@@ -1,5 +1,6 @@
+from functools import lru_cache
 from inspect import Parameter, signature
-from typing import Any, Optional, Union, get_args, get_origin
+from typing import Any, Callable, List, Optional, Union, get_args, get_origin
 
 from toolz import pipe
 from toolz.curried import map, valfilter
@@ -8,6 +9,14 @@ from ..config.ctx import ElroyContext
 from ..io.cli import CliIO
 from ..system_commands import SYSTEM_COMMANDS
 
+SYSTEM_COMMANDS_BY_NAME = {f.__name__: f for f in SYSTEM_COMMANDS}
+
+
+@lru_cache(maxsize=None)
+def _get_params(func: Callable) -> List[Parameter]:
+    # System commands are fixed at import, so each signature is only inspected once
+    return list(signature(func).parameters.values())
+
 
 async def invoke_system_command(ctx: ElroyContext, msg: str) -> str:
     """
@@ -22,12 +31,12 @@ async def invoke_system_command(ctx: ElroyContext, msg: str) -> str:
     command = msg.split(" ")[0]
     input_arg = " ".join(msg.split(" ")[1:])
 
-    func = next((f for f in SYSTEM_COMMANDS if f.__name__ == command), None)
+    func = SYSTEM_COMMANDS_BY_NAME.get(command)
 
     if not func:
         return f"Unknown command: {command}. Valid options are: {', '.join([f.__name__ for f in SYSTEM_COMMANDS])}"
 
-    params = list(signature(func).parameters.values())
+    params = _get_params(func)
 
     # Count non-context parameters
     non_ctx_params = [p for p in params if p.annotation != ElroyContext]
@@ -8,8 +8,6 @@ import typer
 from ..config.ctx import ElroyContext
 from ..db.db_manager import DbManager
 from ..db.db_models import SYSTEM
-from ..db.postgres.postgres_manager import PostgresManager
-from ..db.sqlite.sqlite_manager import SqliteManager
 from ..db.sqlite.utils import path_to_sqlite_url
 from ..io.cli import CliIO
 from ..llm.persona import get_assistant_name
@@ -65,15 +63,16 @@ def init_db(ctx: typer.Context) -> Generator[DbManager, Any, None]:
         logging.warning("ELROY_POSTGRES_URL environment variable has been renamed to ELROY_DATABASE_URL")
         url = os.environ["ELROY_POSTGRES_URL"]
 
+    # Only the backend in use is imported
     if url.startswith("postgresql://"):
-        db_manager = PostgresManager
+        from ..db.postgres.postgres_manager import PostgresManager as db_manager
     elif url.startswith("sqlite:///"):
-        db_manager = SqliteManager
+        from ..db.sqlite.sqlite_manager import SqliteManager as db_manager
     elif path_to_sqlite_url(url):
         logging.warning("SQLite URL provided without 'sqlite:///' prefix, adding it")
         url = path_to_sqlite_url(url)
         assert url
-        db_manager = SqliteManager
+        from ..db.sqlite.sqlite_manager import SqliteManager as db_manager
     else:
         raise ValueError(f"Unsupported database URL: {url}. Must be either a postgresql:// or sqlite:/// URL")
 
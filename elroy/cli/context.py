@@ -6,7 +6,7 @@ from pytz import UTC
 from sqlmodel import select
 
 from ..config.constants import USER
-from ..config.ctx import ElroyContext, clone_ctx_with_db
+from ..config.ctx import ElroyContext
 from ..db.db_models import Message
 from ..messaging.context import context_refresh
 from ..tools.user_preferences import get_user_preferred_name
@@ -22,12 +22,11 @@ def periodic_context_refresh(ctx: ElroyContext):
     async def refresh_loop(ctx: ElroyContext):
         logging.info(f"Pausing for initial context refresh wait of {ctx.initial_refresh_wait}")
         await asyncio.sleep(ctx.initial_refresh_wait.total_seconds())
+        refresh_interval_seconds = ctx.context_refresh_interval.total_seconds()
         while True:
             try:
                 logging.info("Refreshing context")
                 await context_refresh(ctx)  # Keep this async
-                logging.info(f"Wait for {ctx.context_refresh_interval} before next context refresh")
-                await asyncio.sleep(ctx.context_refresh_interval.total_seconds())
             except Exception as e:
                 logging.error(f"Error in periodic context refresh: {e}")
                 ctx.db.rollback()
@@ -35,11 +34,12 @@ def periodic_context_refresh(ctx: ElroyContext):
                 if ctx.debug:
                     raise e
 
+            # Wait out the interval whether or not the refresh succeeded, so a persistent error does not retry in a tight loop
+            logging.info(f"Wait for {ctx.context_refresh_interval} before next context refresh")
+            await asyncio.sleep(refresh_interval_seconds)
+
     try:
-        # hack to get a new session for the thread
-        with ctx.db.get_new_session() as db:
-            new_ctx = clone_ctx_with_db(ctx, db)
-            loop.run_until_complete(refresh_loop(new_ctx))
+        loop.run_until_complete(refresh_loop(ctx))
     finally:
         loop.close()
 
@@ -50,10 +50,11 @@ def get_user_logged_in_message(ctx: ElroyContext) -> str:
     if preferred_name == "Unknown":
         preferred_name = "User apreferred name unknown)"
 
-    local_tz = datetime.now().astimezone().tzinfo
+    # Read the clock once, so the start of today and the reported time agree
+    now = datetime.now().astimezone()
 
     # Get start of today in local timezone
-    today_start = datetime.now(local_tz).replace(hour=0, minute=0, second=0, microsecond=0)
+    today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
 
     # Convert to UTC for database comparison
     today_start_utc = today_start.astimezone(UTC)
@@ -73,4 +74,4 @@ def get_user_logged_in_message(ctx: ElroyContext) -> str:
     else:
         today_summary = f"I haven't chatted with {preferred_name} yet today. I should offer a brief greeting."
 
-    return f"{preferred_name} has logged in. The current time is {datetime_to_string(datetime.now().astimezone())}. {today_summary}"
+    return f"{preferred_name} has logged in. The current time is {datetime_to_string(now)}. {today_summary}"
@@ -33,6 +33,7 @@ from .options import CliOption, get_config_params, resolve_model_alias
 from .updater import check_latest_version
 
 MODEL_ALIASES = ["sonnet", "opus", "gpt4o", "gpt4o_mini", "o1", "o1_mini"]
+MODEL_ALIAS_KEYS = frozenset(MODEL_ALIASES)
 
 app = typer.Typer(
     help="Elroy CLI",
@@ -286,8 +287,7 @@ def common(
     ctx.obj = pipe(
         ctx.params,
         lambda x: merge(get_config_params(ctx.params.get(CONFIG_FILE_KEY)), x),
-        keyfilter(lambda k: k not in MODEL_ALIASES),
-        dict,
+        keyfilter(lambda k: k not in MODEL_ALIAS_KEYS),  # keyfilter returns a new dict, no further copy is needed
         lambda x: ElroyContext(parent=ctx, **x),
     )
 
@@ -373,9 +373,10 @@ def remember(
             raise typer.Exit(1)
     else:
         memory_text = sys.stdin.read()
-        metadata = "Memory ingested from stdin\n" f"Ingested at: {datetime_to_string(datetime.now())}\n"
+        ingested_at = datetime_to_string(datetime.now())
+        metadata = "Memory ingested from stdin\n" f"Ingested at: {ingested_at}\n"
         memory_text = f"{metadata}\n{memory_text}"
-        memory_name = f"Memory from stdin, ingested {datetime_to_string(datetime.now())}"
+        memory_name = f"Memory from stdin, ingested {ingested_at}"
         manually_record_user_memory(ctx, memory_text, memory_name)
         ctx.io.sys_message(f"Memory created: {memory_name}")
         raise typer.Exit()
@@ -389,10 +390,10 @@ def list_models():
         get_supported_openai_models,
     )
 
-    for m in get_supported_openai_models():
-        print(f"{m} (OpenAI)")
-    for m in get_supported_anthropic_models():
-        print(f"{m} (Anthropic)")
+    # Written in a single call, rather than one write per model
+    print(
+        "\n".join([f"{m} (OpenAI)" for m in get_supported_openai_models()] + [f"{m} (Anthropic)" for m in get_supported_anthropic_models()])
+    )
     raise typer.Exit()
 
 
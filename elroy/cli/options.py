@@ -1,6 +1,7 @@
 import logging
+import os
+import stat
 from functools import lru_cache
-from pathlib import Path
 from typing import Any, Dict, Optional
 
 import yaml
@@ -8,22 +9,26 @@ from click import get_current_context
 from toolz import merge
 from typer import Option
 
-from ..config.config import DEFAULTS_CONFIG
+from ..config.config import get_defaults_config
 from ..config.constants import CONFIG_FILE_KEY
 from ..config.models import resolve_anthropic
 from ..config.paths import get_default_config_path
 
+ANTHROPIC_MODEL_ALIASES = frozenset(["sonnet", "opus", "haiku"])
+
+OPENAI_MODEL_ALIASES = {
+    "gpt4o": "gpt-4o",
+    "gpt4o_mini": "gpt-4o-mini",
+    "o1": "o1",
+    "o1_mini": "o1-mini",
+}
+
 
 def resolve_model_alias(alias: str) -> Optional[str]:
-    if alias in ["sonnet", "opus", "haiku"]:
+    if alias in ANTHROPIC_MODEL_ALIASES:
         return resolve_anthropic(alias)
     else:
-        return {
-            "gpt4o": "gpt-4o",
-            "gpt4o_mini": "gpt-4o-mini",
-            "o1": "o1",
-            "o1_mini": "o1-mini",
-        }.get(alias)
+        return OPENAI_MODEL_ALIASES.get(alias)
 
 
 @lru_cache
@@ -31,9 +36,10 @@ def get_config_params(config_path: Optional[str] = None) -> Dict:
     ctx = get_current_context(True)
     ctx_path = ctx.params.get(CONFIG_FILE_KEY) if ctx else None
 
-    user_config_path = config_path or ctx_path or get_default_config_path()
+    # Normalize to str, so that the same file is parsed once regardless of whether it was provided as a str or Path
+    user_config_path = str(config_path or ctx_path or get_default_config_path())
 
-    return merge(DEFAULTS_CONFIG, load_config_if_exists(user_config_path))
+    return merge(get_defaults_config(), load_config_if_exists(user_config_path))
 
 
 def CliOption(yaml_key: str, envvar: Optional[str] = None, *args: Any, **kwargs: Any):
@@ -48,7 +54,7 @@ def CliOption(yaml_key: str, envvar: Optional[str] = None, *args: Any, **kwargs:
         *args,
         default_factory=lambda: get_config_params().get(yaml_key),
         envvar=envvar or f"ELROY_{yaml_key.upper()}",
-        show_default=str(DEFAULTS_CONFIG.get(yaml_key)),
+        show_default=str(get_defaults_config().get(yaml_key)),
         **kwargs,
     )
 
@@ -64,10 +70,17 @@ def load_config_if_exists(user_config_path: Optional[str]) -> dict:
     if not user_config_path:
         return {}
 
-    if not Path(user_config_path).exists():
+    # A single stat call answers both whether the path exists and whether it is a regular file
+    try:
+        config_stat = os.stat(user_config_path)
+    except OSError:
+        # A path that cannot be stat-ed, whether missing or inaccessible, is treated as absent
+        config_stat = None
+
+    if not config_stat:
         logging.info(f"User config file {user_config_path} not found")
         return {}
-    elif not Path(user_config_path).is_file():
+    elif not stat.S_ISREG(config_stat.st_mode):
         logging.error(f"User config path {user_config_path} is not a file")
         return {}
     else:
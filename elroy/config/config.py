@@ -1,18 +1,24 @@
-from dataclasses import dataclass
-from datetime import timedelta
-from importlib.resources import open_text
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Dict, NamedTuple, Optional
 
 import yaml
 
-from .paths import APP_NAME
+from .. import PACKAGE_ROOT
 
-with open_text(APP_NAME, "defaults.yml") as f:
-    DEFAULTS_CONFIG = yaml.safe_load(f)
 
+@lru_cache(maxsize=1)
+def get_defaults_config() -> Dict[str, Any]:
+    return yaml.safe_load((PACKAGE_ROOT / "defaults.yml").read_bytes())
 
-@dataclass
-class ChatModel:
+
+def __getattr__(name: str) -> Any:
+    # DEFAULTS_CONFIG is parsed on first access, rather than whenever this module is imported
+    if name == "DEFAULTS_CONFIG":
+        return get_defaults_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class ChatModel(NamedTuple):
     name: str
     enable_caching: bool
     api_key: Optional[str]
@@ -23,8 +29,7 @@ class ChatModel:
     organization: Optional[str] = None
 
 
-@dataclass
-class EmbeddingModel:
+class EmbeddingModel(NamedTuple):
     model: str
     embedding_size: int
     enable_caching: bool
@@ -33,26 +38,8 @@ class EmbeddingModel:
     organization: Optional[str] = None
 
 
-@dataclass
-class ElroyConfig:
-    database_url: str
-    context_refresh_trigger_tokens: int
-    context_refresh_token_target: int
-    max_in_context_message_age: timedelta
-    context_refresh_interval: timedelta
-    min_convo_age_for_greeting: timedelta
-    enable_assistant_greeting: bool
-    l2_memory_relevance_distance_threshold: float
-    l2_memory_consolidation_distance_threshold: float
-    initial_refresh_wait: timedelta
-    chat_model: ChatModel
-    embedding_model: EmbeddingModel
-    debug_mode: bool
-    log_file_path: str
-    default_persona: str
-    default_assistant_name: str
-
-
+# Model settings are fixed for the life of the process, so contexts built with the same settings share one resolved model
+@lru_cache(maxsize=None)
 def get_chat_model(
     model_name: str,
     openai_api_key: Optional[str],
@@ -61,15 +48,15 @@ def get_chat_model(
     organization: Optional[str],
     enable_caching: bool,
 ) -> ChatModel:
-    pass
+    from .models import ANTHROPIC, OPENAI, get_provider
 
-    from .models import get_supported_anthropic_models, get_supported_openai_models
+    provider = get_provider(model_name)
 
-    if model_name in get_supported_anthropic_models():
+    if provider == ANTHROPIC:
         assert anthropic_api_key is not None, "Anthropic API key is required for Anthropic chat models"
         ensure_alternating_roles = True
         api_key = anthropic_api_key
-    elif model_name in get_supported_openai_models():
+    elif provider == OPENAI:
         assert openai_api_key is not None, "OpenAI API key is required for OpenAI chat models"
         ensure_alternating_roles = False
         api_key = openai_api_key
@@ -87,6 +74,7 @@ def get_chat_model(
     )
 
 
+@lru_cache(maxsize=None)
 def get_embedding_model(
     model_name: str, embedding_size: int, api_key: Optional[str], api_base: Optional[str], organization: Optional[str], enable_caching: bool
 ) -> EmbeddingModel:
@@ -33,12 +33,18 @@ REPO_ISSUES_URL = "https://github.com/elroy-bot/elroy/issues"
 
 BUG_REPORT_LOG_LINES = 15
 
+# Failed tool calls are reported back to the model, and stay in context, with only the innermost frames of their traceback
+TOOL_ERROR_TRACEBACK_FRAMES = 5
+
 LIST_MODELS_FLAG = "--list-models"
 
 MODEL_SELECTION_CONFIG_PANEL = "Model Selection and Configuration"
 
 MAX_CHAT_COMPLETION_RETRY_COUNT = 2
 
+# After a rate limit or internal server error, completions go straight to the fallback model for this long
+FAILED_MODEL_COOLDOWN_SECONDS = 60
+
 CONFIG_FILE_KEY = "config_file"
 
 
@@ -1,25 +1,49 @@
+import copy
 import sys
 from contextlib import contextmanager
 from datetime import timedelta
-from functools import cached_property, wraps
+from functools import wraps
 from pathlib import Path
-from typing import Any, Callable, Generator, Optional, TypeVar, Union
+from typing import Any, Callable, Generator, Generic, Optional, Type, TypeVar, Union
 
 import click
 import typer
 
 from ..db.db_manager import DbManager
-from ..db.postgres.postgres_manager import PostgresManager
-from ..db.sqlite.sqlite_manager import SqliteManager
+from ..io.base import ElroyIO, StdIO
 from ..repository.user import create_user_id, get_user_id_if_exists
 from .config import ChatModel, EmbeddingModel, get_chat_model, get_embedding_model
 
+R = TypeVar("R")
 
-class ElroyContext(typer.Context):
-    from ..io.base import ElroyIO
-    from ..io.cli import CliIO
+_MISSING = object()
+
+
+class cached_property(Generic[R]):
+    """
+    Minimal equivalent of functools.cached_property. On Python < 3.12 the functools version computes values under a lock
+    shared by every instance of the class, which serializes first access across contexts on different threads.
+    """
+
+    def __init__(self, func: Callable[[Any], R]):
+        self.func = func
+        self.__doc__ = func.__doc__
 
-    _db: Optional[DbManager] = None
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> R:
+        if instance is None:
+            return self  # type: ignore
+        value = instance.__dict__.get(self.name, _MISSING)
+        if value is _MISSING:
+            value = instance.__dict__.setdefault(self.name, self.func(instance))
+        return value
+
+
+class ElroyContext(typer.Context):
+    # Set as a plain instance attribute while a session is open, so reads skip a property call. See __getattr__.
+    db: DbManager
     _io: Optional[ElroyIO] = None
 
     def __init__(
@@ -103,6 +127,7 @@ class ElroyContext(typer.Context):
         self.max_context_age_minutes = max_context_age_minutes
         self.context_refresh_interval_minutes = context_refresh_interval_minutes
         self.min_convo_age_for_greeting_minutes = min_convo_age_for_greeting_minutes
+        self.min_convo_age_for_greeting = timedelta(minutes=min_convo_age_for_greeting_minutes)
         self.enable_assistant_greeting = enable_assistant_greeting
         self.max_in_context_message_age = timedelta(minutes=max_context_age_minutes)
         self.initial_refresh_wait = timedelta(seconds=initial_context_refresh_wait_seconds)
@@ -121,10 +146,6 @@ class ElroyContext(typer.Context):
 
         self.tool = tool
 
-    @property
-    def min_convo_age_for_greeting(self) -> timedelta:
-        return timedelta(minutes=self.min_convo_age_for_greeting_minutes)
-
     @cached_property
     def chat_model(self) -> ChatModel:
         return get_chat_model(
@@ -166,10 +187,22 @@ class ElroyContext(typer.Context):
             self._is_new_user = True
         return self._user_id
 
+    @cached_property
+    def db_manager(self) -> Type[DbManager]:
+        # Resolved once per context, rather than on every with_db call
+        if self.database_url.startswith("postgresql://"):
+            from ..db.postgres.postgres_manager import PostgresManager
+
+            return PostgresManager
+        elif self.database_url.startswith("sqlite:///"):
+            from ..db.sqlite.sqlite_manager import SqliteManager
+
+            return SqliteManager
+        else:
+            raise ValueError(f"Unsupported database URL: {self.database_url}. Must be either a postgresql:// or sqlite:/// URL")
+
     @property
     def io(self) -> ElroyIO:
-        from ..io.base import StdIO
-
         if not self._io:
             if sys.stdin.isatty():
                 from ..io.cli import CliIO
@@ -188,21 +221,20 @@ class ElroyContext(typer.Context):
 
         return self._io
 
-    @property
-    def db(self) -> DbManager:
-        if not self._db:
+    def __getattr__(self, name: str) -> Any:
+        # Only called when normal lookup fails, i.e. for db when no session is open
+        if name == "db":
             raise ValueError("No db session open")
-        else:
-            return self._db
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
 
     @contextmanager
     def with_db(self, db: DbManager) -> Generator[None, None, None]:
         """Context manager for database sessions"""
         try:
-            self._db = db
+            self.db = db
             yield
         finally:
-            self._db = None
+            self.__dict__.pop("db", None)
 
 
 def get_ctx(typer_ctx: Union[typer.Context, ElroyContext]) -> ElroyContext:
@@ -234,64 +266,24 @@ def elroy_context(func: T) -> T:
 
 
 def clone_ctx_with_db(ctx: ElroyContext, db: DbManager) -> ElroyContext:
+    """
+    Returns a copy of the context bound to the given db session.
 
-    new_ctx = ElroyContext(
-        command=ctx.command,
-        parent=ctx.parent,  # type: ignore
-        config_file=ctx.config_file,
-        database_url=ctx.database_url,
-        show_internal_thought=ctx.show_internal_thought,
-        system_message_color=ctx.system_message_color,
-        assistant_color=ctx.assistant_color,
-        user_input_color=ctx.user_input_color,
-        warning_color=ctx.warning_color,
-        internal_thought_color=ctx.internal_thought_color,
-        user_token=ctx.user_token,
-        openai_api_key=ctx.openai_api_key,
-        openai_api_base=ctx.openai_api_base,
-        openai_embedding_api_base=ctx.openai_embedding_api_base,
-        openai_organization=ctx.openai_organization,
-        anthropic_api_key=ctx.anthropic_api_key,
-        chat_model=ctx.chat_model_name,
-        embedding_model=ctx.embedding_model_name,
-        embedding_model_size=ctx.embedding_model_size,
-        enable_caching=ctx.enable_caching,
-        context_refresh_trigger_tokens=ctx.context_refresh_trigger_tokens,
-        context_refresh_target_tokens=ctx.context_refresh_target_tokens,
-        max_context_age_minutes=ctx.max_context_age_minutes,
-        context_refresh_interval_minutes=ctx.context_refresh_interval_minutes,
-        min_convo_age_for_greeting_minutes=ctx.min_convo_age_for_greeting_minutes,
-        enable_assistant_greeting=ctx.enable_assistant_greeting,
-        initial_context_refresh_wait_seconds=ctx.initial_context_refresh_wait_seconds,
-        l2_memory_relevance_distance_threshold=ctx.l2_memory_relevance_distance_threshold,
-        l2_memory_consolidation_distance_threshold=ctx.l2_memory_consolidation_distance_threshold,
-        debug=ctx.debug,
-        log_file_path=str(ctx.log_file_path),
-        max_assistant_loops=ctx.max_assistant_loops,
-        default_persona=ctx.default_persona,
-        default_assistant_name=ctx.default_assistant_name,
-        tool=ctx.tool,
-        enable_tools=ctx.enable_tools,
-    )
-    new_ctx._db = db
+    The copy bypasses __init__: it shares the source context's configuration along with anything the source has already
+    resolved (models, user id, io), and only swaps in its own db session.
+    """
+    new_ctx = copy.copy(ctx)
+    new_ctx.db = db
     return new_ctx
 
 
 def with_db(func):
     """Decorator that provides database connection to ElroyContext methods"""
-    from functools import wraps
 
     @wraps(func)
     def wrapper(ctx: ElroyContext, *args, **kwargs):
 
-        if ctx.database_url.startswith("postgresql://"):
-            db_manager = PostgresManager
-        elif ctx.database_url.startswith("sqlite:///"):
-            db_manager = SqliteManager
-        else:
-            raise ValueError(f"Unsupported database URL: {ctx.database_url}. Must be either a postgresql:// or sqlite:/// URL")
-
-        with db_manager.open_session(ctx.database_url, True) as db:
+        with ctx.db_manager.open_session(ctx.database_url, True) as db:
             with ctx.with_db(db):
                 return func(ctx, *args, **kwargs)
 
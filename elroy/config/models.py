@@ -1,21 +1,33 @@
 import re
-from functools import partial
-from typing import List, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
-from toolz import assoc, first, pipe
+from toolz import first, pipe
 from toolz.curried import filter
 
 from .config import ChatModel
 
+# Chat models are gpt-N or o1 models, excluding vision and audio variants
+OPENAI_CHAT_MODEL_PATTERN = re.compile(r"^(?!.*(?:vision|audio))(?:gpt-\d|o1)")
+OPENAI_VERSION_PATTERN = re.compile(r"-(\d{4})$")
+OPENAI_DATE_PATTERN = re.compile(r"\d{4}-(?:0[1-9]|1[0-2])-(?:0[1-9]|[12]\d|3[01])")
+ANTHROPIC_VERSION_PATTERN = re.compile(r"claude-(?:instant-)?(\d+)(?:\.(\d+))?")
+ANTHROPIC_DATE_PATTERN = re.compile(r"(\d{8})")
 
+OPENAI, ANTHROPIC = "openai", "anthropic"
+
+
+@lru_cache(maxsize=None)
 def resolve_anthropic(pattern: str) -> str:
+    regex = re.compile(pattern, re.IGNORECASE)
     return pipe(
         get_supported_anthropic_models(),
-        filter(lambda x: re.search(pattern, x, re.IGNORECASE)),
+        filter(regex.search),
         first,
     )  # type: ignore
 
 
+@lru_cache(maxsize=1)
 def get_supported_openai_models() -> List[str]:
     from litellm import open_ai_chat_completion_models
 
@@ -49,13 +61,13 @@ def get_supported_openai_models() -> List[str]:
             modifier = 0
 
         # Version number adjustment (e.g., 0125 in gpt-4-0125-preview)
-        version_match = re.search(r"-(\d{4})$", model_name)
+        version_match = OPENAI_VERSION_PATTERN.search(model_name)
         if version_match:
             version_num = int(version_match.group(1))
         else:
             version_num = 0
 
-        date_match = re.search(r"\d{4}-(?:0[1-9]|1[0-2])-(?:0[1-9]|[12]\d|3[01])", model_name)
+        date_match = OPENAI_DATE_PATTERN.search(model_name)
         if date_match:
             date_int = int(date_match.group(0).replace("-", ""))
         else:
@@ -64,15 +76,15 @@ def get_supported_openai_models() -> List[str]:
 
         return (score, modifier, version_num, date_int)
 
+    # Filter before sorting, so that only chat models are scored
     return pipe(
-        sorted(open_ai_chat_completion_models, key=_model_sort, reverse=True),
-        filter(partial(re.search, r"^gpt-\d|^o1")),
-        filter(lambda x: "vision" not in x),
-        filter(lambda x: "audio" not in x),
-        list,
-    )
+        open_ai_chat_completion_models,
+        filter(OPENAI_CHAT_MODEL_PATTERN.match),
+        lambda models: sorted(models, key=_model_sort, reverse=True),
+    )  # type: ignore
 
 
+@lru_cache(maxsize=1)
 def get_supported_anthropic_models() -> List[str]:
     from litellm import anthropic_models
 
@@ -82,7 +94,7 @@ def get_supported_anthropic_models() -> List[str]:
         Higher scores indicate more powerful models.
         """
 
-        version_match = re.search(r"claude-(?:instant-)?(\d+)(?:\.(\d+))?", model_name)
+        version_match = ANTHROPIC_VERSION_PATTERN.search(model_name)
         if version_match:
             major = int(version_match.group(1))
             minor = int(version_match.group(2)) if version_match.group(2) else 0
@@ -90,7 +102,7 @@ def get_supported_anthropic_models() -> List[str]:
         else:
             version = 0.0
 
-        date_match = re.search(r"(\d{8})", model_name)
+        date_match = ANTHROPIC_DATE_PATTERN.search(model_name)
         date = int(date_match.group(1)) if date_match else 0
 
         # Base score based on major version and subversion
@@ -112,26 +124,39 @@ def get_supported_anthropic_models() -> List[str]:
     return sorted(anthropic_models, key=_model_sort, reverse=True)
 
 
+def get_supported_models(provider: str) -> List[str]:
+    return get_supported_openai_models() if provider == OPENAI else get_supported_anthropic_models()
+
+
+@lru_cache(maxsize=1)
+def get_known_models() -> Dict[str, Tuple[str, int]]:
+    """
+    Returns a mapping of model name to its provider and its rank within the provider's model list (0 = most powerful).
+    """
+    known_models = {}
+    # Anthropic is added last so that it takes precedence, should a model name appear under both providers.
+    for provider in (OPENAI, ANTHROPIC):
+        for idx, model_name in enumerate(get_supported_models(provider)):
+            known_models[model_name] = (provider, idx)
+    return known_models
+
+
+def get_provider(model_name: str) -> Optional[str]:
+    known_model = get_known_models().get(model_name)
+    return known_model[0] if known_model else None
+
+
 def get_fallback_model(chat_model: ChatModel) -> Optional[ChatModel]:
-    openai_models = get_supported_openai_models()
-    anthropic_models = get_supported_anthropic_models()
-
-    if chat_model.name in openai_models:
-        model_list = openai_models
-    elif chat_model.name in anthropic_models:
-        model_list = anthropic_models
-    else:
+    known_model = get_known_models().get(chat_model.name)
+    if not known_model:
         return None
 
-    idx = model_list.index(chat_model.name) + 1
-    if idx > len(model_list) - 1:
+    provider, idx = known_model
+    model_list = get_supported_models(provider)
+    if idx + 1 > len(model_list) - 1:
         return None
 
-    name = model_list[idx]
+    name = model_list[idx + 1]
 
     # duplicate all settings, asside from the name
-    return pipe(
-        chat_model.__dict__,
-        lambda x: assoc(x, "name", name),
-        lambda x: ChatModel(**x),
-    )  # type: ignore
+    return chat_model._replace(name=name)
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from pathlib import Path
 
 from platformdirs import user_cache_dir, user_data_dir
@@ -6,6 +7,8 @@ APP_NAME = "elroy"
 APP_AUTHOR = "elroy-bot"
 
 
+# The directories are resolved, and created if needed, once per process
+@lru_cache(maxsize=1)
 def get_elroy_home() -> Path:
     """Get the Elroy home directory, creating it if it doesn't exist.
 
@@ -23,6 +26,7 @@ def get_default_config_path() -> Path:
     return get_elroy_home() / "elroy.conf.yaml"
 
 
+@lru_cache(maxsize=1)
 def get_elroy_cache() -> Path:
     """Get the Elroy cache directory, creating it if it doesn't exist.
 
@@ -2,20 +2,21 @@ import contextlib
 import logging
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
+from functools import lru_cache
 from io import StringIO
 from pathlib import Path
-from typing import Any, Generator, Iterable, List, Optional, Tuple, Type
+from typing import Any, Generator, Iterable, List, Optional, Set, Tuple, Type
 
 import typer
-from alembic import command
-from alembic.config import Config
-from alembic.runtime.migration import MigrationContext
-from alembic.script import ScriptDirectory
 from sqlalchemy import Engine
 from sqlmodel import Session, select, text
 
+from ..config.constants import RESULT_SET_LIMIT_COUNT
 from .db_models import EmbeddableSqlModel, EmbeddableType, VectorStorage
 
+# Urls that have passed the connectivity and migration check in this process. Later sessions on the same url skip the check.
+MIGRATION_CHECKED_URLS: Set[str] = set()
+
 
 class DbManager(ABC):
     def __init__(self, url: str, session: Session):
@@ -26,6 +27,12 @@ class DbManager(ABC):
     def get_engine(cls, url: str) -> Engine:
         raise NotImplementedError
 
+    @classmethod
+    @lru_cache(maxsize=None)
+    def get_shared_engine(cls, url: str) -> Engine:
+        """Engine for the url, created once per process so that every session on the url shares its connection pool"""
+        return cls.get_engine(url)
+
     @classmethod
     @abstractmethod
     def is_valid_url(cls, url: str) -> bool:
@@ -36,15 +43,11 @@ class DbManager(ABC):
         """Returns the SQL operator for vector distance calculations"""
         raise NotImplementedError
 
-    @abstractmethod
-    def get_vector_storage_row(self, row: EmbeddableSqlModel) -> Optional[VectorStorage]:
-        raise NotImplementedError
-
     @abstractmethod
     def insert_embedding(self, row: EmbeddableSqlModel, embedding_data: List[float], embedding_text_md5: str):
         raise NotImplementedError
 
-    def update_embedding(self, vector_storage: VectorStorage, embedding: List[float], embedding_text_md5: str):
+    def update_embedding(self, row: EmbeddableSqlModel, embedding: List[float], embedding_text_md5: str):
         raise NotImplementedError
 
     @abstractmethod
@@ -70,17 +73,29 @@ class DbManager(ABC):
 
     @abstractmethod
     def query_vector(
-        self, l2_distance_threshold: float, table: Type[EmbeddableSqlModel], user_id: int, query: List[float]
+        self,
+        l2_distance_threshold: float,
+        table: Type[EmbeddableSqlModel],
+        user_id: int,
+        query: List[float],
+        limit: int = RESULT_SET_LIMIT_COUNT,
     ) -> Iterable[EmbeddableSqlModel]:
         raise NotImplementedError
 
     @classmethod
     @contextmanager
     def open_session(cls, url: str, check_migrations: bool) -> Generator["DbManager", Any, None]:
-        engine = cls.get_engine(url)
-        if check_migrations:
+        engine = cls.get_shared_engine(url)
+        if check_migrations and url not in MIGRATION_CHECKED_URLS:
             cls._migrate_if_needed(engine)
+            MIGRATION_CHECKED_URLS.add(url)
+
+        with cls._session_scope(url, engine) as db:
+            yield db
 
+    @classmethod
+    @contextmanager
+    def _session_scope(cls, url: str, engine: Engine) -> Generator["DbManager", Any, None]:
         session = Session(engine)
         try:
             yield cls(url, session)
@@ -98,10 +113,10 @@ class DbManager(ABC):
     @contextmanager
     def get_new_session(self) -> Generator["DbManager", Any, None]:
         """
-        Spawns a new DbManager with same params
+        Spawns a new DbManager with same params, with its own session on this manager's engine
         """
 
-        with self.__class__.open_session(self.url, False) as db:
+        with self.__class__._session_scope(self.url, self.session.get_bind()) as db:  # type: ignore
             yield db
 
     @property
@@ -120,6 +135,10 @@ class DbManager(ABC):
     def commit(self):
         return self.session.commit
 
+    @property
+    def flush(self):
+        return self.session.flush
+
     @property
     def refresh(self):
         return self.session.refresh
@@ -133,8 +152,9 @@ class DbManager(ABC):
         """Check if all migrations have been run.
         Returns True if migrations are up to date, False otherwise."""
         try:
-            with Session(engine) as session:
-                session.exec(text("SELECT 1")).first()  # type: ignore
+            # A bare connection suffices for the connectivity check, no ORM session is needed
+            with engine.connect() as connection:
+                connection.execute(text("SELECT 1")).first()
         except Exception as e:
             logging.error(f"Database connectivity check failed: {e}")
             raise typer.BadParameter(
@@ -143,6 +163,12 @@ class DbManager(ABC):
 
         """Check if all migrations have been run.
         Returns True if migrations are up to date, False otherwise."""
+        # alembic is slow to import, and is only needed once a session is opened
+        from alembic import command
+        from alembic.config import Config
+        from alembic.runtime.migration import MigrationContext
+        from alembic.script import ScriptDirectory
+
         config = Config(cls._get_config_path())
         config.set_main_option("sqlalchemy.url", engine.url.render_as_string(hide_password=False))
 
@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional, TypeVar
 
 from pgvector.sqlalchemy import Vector
-from sqlalchemy import Column, Text, UniqueConstraint
+from sqlalchemy import Column, Index, Text, UniqueConstraint
 from sqlmodel import Column, Field, SQLModel
 from toolz import pipe
 from toolz.curried import filter
@@ -33,6 +33,8 @@ class FunctionCall:
     Internal representation of a tool call, formatted for simpler execution logic
     """
 
+    __slots__ = ("id", "function_name", "arguments")
+
     # Formatted for ease of execution
     id: str
     function_name: str
@@ -44,6 +46,8 @@ class FunctionCall:
 
 @dataclass
 class MemoryMetadata:
+    __slots__ = ("memory_type", "id", "name")
+
     memory_type: str
     id: int
     name: str
@@ -52,7 +56,8 @@ class MemoryMetadata:
 class VectorStorage(SQLModel, table=True):
     """Table for storing vector embeddings for any model type"""
 
-    __table_args__ = {"extend_existing": True}
+    # Created by migration on postgres only, sqlite stores vectors in a sqlite-vec virtual table, which cannot be indexed
+    __table_args__ = (Index("ix_vectorstorage_source_type_source_id", "source_type", "source_id"), {"extend_existing": True})
     id: Optional[int] = Field(default=None, primary_key=True)
     source_type: str = Field(..., description="The type of model this embedding is for (e.g. Memory, Goal)")
     source_id: int = Field(..., description="The ID of the source model")
@@ -0,0 +1,26 @@
+"""index vectorstorage by source
+
+Revision ID: 42d49be35441
+Revises: 66a25cb7d3ef
+Create Date: 2026-10-17 10:12:04.118203
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "42d49be35441"
+down_revision: Union[str, None] = "66a25cb7d3ef"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Every vector lookup and join filters on (source_type, source_id), so only the queried type's rows are visited
+    op.create_index("ix_vectorstorage_source_type_source_id", "vectorstorage", ["source_type", "source_id"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_vectorstorage_source_type_source_id", table_name="vectorstorage")
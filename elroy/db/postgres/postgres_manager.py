@@ -3,7 +3,7 @@ import re
 from pathlib import Path
 from typing import Iterable, List, Optional, Tuple, Type
 
-from sqlalchemy import Engine, NullPool, create_engine, select
+from sqlalchemy import Engine, create_engine, select, update
 from sqlalchemy.orm import aliased
 from sqlmodel import Session, and_, func, select, text
 from toolz import pipe
@@ -14,25 +14,33 @@ from ...config.constants import RESULT_SET_LIMIT_COUNT
 from ..db_manager import DbManager
 from ..db_models import EmbeddableSqlModel, EmbeddableType, VectorStorage
 
+POSTGRES_URL_PATTERN = re.compile(
+    r"^postgresql(?:ql)?:\/\/"  # Protocol
+    r"(?:(?:[^:@\/]+)(?::([^@\/]+))?@)?"  # User and password
+    r"[^:@\/]+(?::\d+)?"  # Host and port
+    r"\/[^?\/]+"  # Database name
+    r"(?:\?[^#\/]+)?$"  # Query parameters (optional)
+)
+
+# Concurrent sessions are the foreground chat, periodic context refresh, and a background contemplation
+POOL_SIZE = 3
+POOL_MAX_OVERFLOW = 2
+
 
 class PostgresManager(DbManager):
 
     @classmethod
     def is_valid_url(cls, url):
-        pattern = r"^postgresql(?:ql)?:\/\/"  # Protocol
-        pattern += r"(?:(?:[^:@\/]+)(?::([^@\/]+))?@)?"  # User and password
-        pattern += r"[^:@\/]+(?::\d+)?"  # Host and port
-        pattern += r"\/[^?\/]+"  # Database name
-        pattern += r"(?:\?[^#\/]+)?$"  # Query parameters (optional)
-
-        return bool(re.match(pattern, url))
+        return bool(POSTGRES_URL_PATTERN.match(url))
 
     @classmethod
     def get_engine(cls, url: str) -> Engine:
         if not cls.is_valid_url(url):
             raise ValueError(f"Invalid database URL: {url}")
 
-        return create_engine(url, poolclass=NullPool)
+        # Background threads open their sessions on this engine, a small pool lets them reuse connections rather than
+        # reconnecting for every session.
+        return create_engine(url, pool_size=POOL_SIZE, max_overflow=POOL_MAX_OVERFLOW, pool_pre_ping=True)
 
     def get_embedding(self, row: EmbeddableSqlModel) -> Optional[List[float]]:
         return self.exec(
@@ -41,11 +49,6 @@ class PostgresManager(DbManager):
             )  # type: ignore
         ).first()  # type: ignore
 
-    def get_vector_storage_row(self, row: EmbeddableSqlModel) -> Optional[VectorStorage]:
-        return self.session.exec(
-            select(VectorStorage).where(VectorStorage.source_type == row.__class__.__name__, VectorStorage.source_id == row.id)
-        ).first()
-
     def find_redundant_pairs(
         self,
         table: Type[EmbeddableType],
@@ -95,10 +98,12 @@ class PostgresManager(DbManager):
             map(lambda row: (row[0], row[1])),
         )  # type: ignore
 
-    def update_embedding(self, vector_storage: VectorStorage, embedding: List[float], embedding_text_md5: str):
-        vector_storage.embedding_data = embedding
-        vector_storage.embedding_text_md5 = embedding_text_md5
-        self.session.add(vector_storage)
+    def update_embedding(self, row: EmbeddableSqlModel, embedding: List[float], embedding_text_md5: str):
+        self.session.exec(
+            update(VectorStorage)
+            .where(VectorStorage.source_type == row.__class__.__name__, VectorStorage.source_id == row.id)  # type: ignore
+            .values(embedding_data=embedding, embedding_text_md5=embedding_text_md5)
+        )  # type: ignore
         self.session.commit()
 
     def insert_embedding(self, row: EmbeddableSqlModel, embedding_data, embedding_text_md5):
@@ -112,7 +117,12 @@ class PostgresManager(DbManager):
         self.session.commit()
 
     def query_vector(
-        self, l2_distance_threshold: float, table: Type[EmbeddableSqlModel], user_id: int, query: List[float]
+        self,
+        l2_distance_threshold: float,
+        table: Type[EmbeddableSqlModel],
+        user_id: int,
+        query: List[float],
+        limit: int = RESULT_SET_LIMIT_COUNT,
     ) -> Iterable[EmbeddableSqlModel]:
         """
         Perform a vector search on the specified table using the given query.
@@ -146,7 +156,7 @@ class PostgresManager(DbManager):
                     )
                 )
                 .order_by(distance_exp)
-                .limit(RESULT_SET_LIMIT_COUNT)  # type: ignore
+                .limit(limit)  # type: ignore
             ),
             map(lambda row: row[0]),
         )
@@ -1,19 +1,29 @@
 import logging
 import re
 import sqlite3
+from array import array
 from pathlib import Path
-from struct import unpack
 from typing import Iterable, List, Optional, Tuple, Type
 
 import sqlite_vec
 from sqlalchemy import Engine, create_engine, text
-from toolz import assoc, pipe
+from toolz import pipe
 from toolz.curried import map
 
 from ... import PACKAGE_ROOT
 from ...config.constants import EMBEDDING_SIZE, RESULT_SET_LIMIT_COUNT
 from ..db_manager import DbManager
-from ..db_models import EmbeddableSqlModel, EmbeddableType, VectorStorage
+from ..db_models import EmbeddableSqlModel, EmbeddableType
+
+SQLITE_URL_PATTERN = re.compile(
+    r"^sqlite:\/\/"  # Protocol
+    r"(?:\/)?"  # Optional extra slash for Windows absolute paths
+    r"(?:"  # Start of non-capturing group for alternatives
+    r":memory:|"  # In-memory database option
+    r"\/[^?]+"  # Path to database file
+    r")"  # End of alternatives group
+    r"(?:\?[^#]+)?$"  # Query parameters (optional)
+)
 
 
 class SqliteManager(DbManager):
@@ -21,30 +31,7 @@ class SqliteManager(DbManager):
     def _get_config_path(cls):
         return Path(str(PACKAGE_ROOT / "db" / "sqlite" / "alembic" / "alembic.ini"))
 
-    def get_vector_storage_row(self, row: EmbeddableSqlModel) -> Optional[VectorStorage]:
-        """Get vector storage entry for a given source type and id"""
-        result = self.session.exec(
-            text(
-                """
-                SELECT * FROM vectorstorage
-                WHERE source_type = :source_type AND source_id = :source_id
-            """
-            ).bindparams(
-                source_type=row.__class__.__name__, source_id=row.id
-            )  # type: ignore
-        ).first()
-
-        if result is None:
-            return None
-
-        # Convert row to VectorStorage instance
-        return pipe(
-            dict(result._mapping),  # Convert SQLAlchemy Row to dict
-            lambda d: assoc(d, "embedding_data", self._deserialize_embedding(d["embedding_data"])),
-            VectorStorage.model_validate,
-        )  # type: ignore
-
-    def update_embedding(self, vector_storage: VectorStorage, embedding: List[float], embedding_text_md5: str):
+    def update_embedding(self, row: EmbeddableSqlModel, embedding: List[float], embedding_text_md5: str):
         # Use sqlite_vec's serialize_float32 to properly format the vector data
         serialized_vector = sqlite_vec.serialize_float32(embedding)
 
@@ -61,8 +48,8 @@ class SqliteManager(DbManager):
             ).bindparams(
                 embedding_data=serialized_vector,
                 embedding_text_md5=embedding_text_md5,
-                source_type=vector_storage.source_type,
-                source_id=vector_storage.source_id,
+                source_type=row.__class__.__name__,
+                source_id=row.id,
             )  # type: ignore
         )
         self.session.commit()
@@ -112,27 +99,24 @@ class SqliteManager(DbManager):
 
     def _deserialize_embedding(self, data: bytes) -> List[float]:
         """Deserialize binary vector data from SQLite into a list of floats"""
-        return list(unpack(f"{EMBEDDING_SIZE}f", data))
+        # sqlite-vec stores native float32s, read them straight into a list rather than through an intermediate tuple
+        embedding = array("f", data).tolist()
+        if len(embedding) != EMBEDDING_SIZE:
+            raise ValueError(f"Expected {EMBEDDING_SIZE} floats in stored embedding, got {len(embedding)}")
+        return embedding
 
     def query_vector(
-        self, l2_distance_threshold: float, table: Type[EmbeddableSqlModel], user_id: int, query: List[float]
+        self,
+        l2_distance_threshold: float,
+        table: Type[EmbeddableSqlModel],
+        user_id: int,
+        query: List[float],
+        limit: int = RESULT_SET_LIMIT_COUNT,
     ) -> Iterable[EmbeddableSqlModel]:
 
         # Serialize the vector once
         serialized_query = sqlite_vec.serialize_float32(query)
 
-        # Raw SQL query
-        sql = f"""
-        SELECT {table.__tablename__}.*, vec_distance_L2(VectorStorage.embedding_data, ?) as distance
-        FROM {table.__tablename__}
-        JOIN vectorstorage ON vectorstorage.source_type = ? AND vectorstorage.source_id = {table.__tablename__}.id
-        WHERE {table.__tablename__}.user_id = ?
-        AND {table.__tablename__}.is_active = 1
-        AND vec_distance_L2(VectorStorage.embedding_data, ?) < ?
-        ORDER BY distance
-        LIMIT ?
-        """
-
         results = self.session.exec(
             text(
                 f"""
@@ -151,7 +135,7 @@ class SqliteManager(DbManager):
                 source_type=table.__name__,
                 user_id=user_id,
                 threshold=l2_distance_threshold,
-                limit=RESULT_SET_LIMIT_COUNT,
+                limit=limit,
             )  # type: ignore
         )
 
@@ -240,21 +224,16 @@ class SqliteManager(DbManager):
 
     @classmethod
     def is_valid_url(cls, url):
-        pattern = r"^sqlite:\/\/"  # Protocol
-        pattern += r"(?:\/)?"  # Optional extra slash for Windows absolute paths
-        pattern += r"(?:"  # Start of non-capturing group for alternatives
-        pattern += r":memory:|"  # In-memory database option
-        pattern += r"\/[^?]+"  # Path to database file
-        pattern += r")"  # End of alternatives group
-        pattern += r"(?:\?[^#]+)?$"  # Query parameters (optional)
-        return bool(re.match(pattern, url))
+        return bool(SQLITE_URL_PATTERN.match(url))
 
     @classmethod
     def get_engine(cls, url: str) -> Engine:
         def _sqlite_connect(url):
             # Strip sqlite:/// prefix if present
             db_path = url.replace("sqlite:///", "")
-            conn = sqlite3.connect(db_path)
+            # Pooled connections may be checked out by sessions on other threads. The pool ensures a connection is only
+            # used by one session at a time, as with SQLAlchemy's own file-based SQLite engines.
+            conn = sqlite3.connect(db_path, check_same_thread=False)
             logging.debug(f"SQLite version: {sqlite3.sqlite_version}")  # Shows SQLite version
 
             logging.debug("Loading vec extension")
@@ -15,8 +15,8 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.pretty import Pretty
 from rich.text import Text
-from toolz import concatv, pipe
-from toolz.curried import map
+from toolz import concat, concatv, pipe
+from toolz.curried import filter, map
 
 from ..config.constants import REPO_ISSUES_URL
 from ..config.paths import get_prompt_history_path
@@ -112,7 +112,7 @@ class CliIO(ElroyIO):
             self.is_streaming_output = True
             try:
                 for chunk in message:
-                    self.console.print(f"[{self.assistant_message_color}]{chunk}[/]", end="")
+                    self.console.print(Text(chunk, style=self.assistant_message_color), end="")
             except KeyboardInterrupt:
                 self.console.print()
                 return
@@ -134,19 +134,22 @@ class CliIO(ElroyIO):
             escaped_message = escape(str(message))
             print_formatted_text(HTML(f'<style fg="{self.system_message_color}">{escaped_message}\n</style>'))
 
+    # Multi-line notices are written with a single console call, so they cannot be interleaved with output from other threads
     def notify_function_call(self, function_call: FunctionCall) -> None:
-        self.console.print()
         msg = f"[{self.system_message_color}]Executing function call: [bold]{function_call.function_name}[/bold]"
 
         if function_call.arguments:
-            self.console.print(msg + f" with arguments:[/]", Pretty(function_call.arguments))
+            self.console.print("", msg + f" with arguments:[/]", Pretty(function_call.arguments), sep="\n")
         else:
-            self.console.print(msg + "[/]")
+            self.console.print("", msg + "[/]", sep="\n")
 
     def notify_warning(self, message: str) -> None:
-        self.console.print(Text(message, justify="center", style=self.warning_color))  # type: ignore
-        self.console.print(f"[{self.warning_color}]Please provide feedback at {REPO_ISSUES_URL}[/]")
-        self.console.print()
+        self.console.print(
+            Text(message, justify="center", style=self.warning_color),  # type: ignore
+            f"[{self.warning_color}]Please provide feedback at {REPO_ISSUES_URL}[/]",
+            sep="\n",
+            end="\n\n",
+        )
 
     def print_memory_panel(self, titles: List[str]):
         if titles:
@@ -181,7 +184,6 @@ class CliIO(ElroyIO):
             return await self.prompt_user(prompt, prefill, keyboard_interrupt_count)
 
     def update_completer(self, goals: List[Goal], memories: List[Memory], context_messages: List[ContextMessage]) -> None:
-        from ..messaging.context import is_memory_in_context
         from ..system_commands import (
             ALL_ACTIVE_GOAL_COMMANDS,
             ALL_ACTIVE_MEMORY_COMMANDS,
@@ -193,18 +195,29 @@ class CliIO(ElroyIO):
             USER_ONLY_COMMANDS,
         )
 
-        in_context_goal_names = sorted([g.get_name() for g in goals if is_memory_in_context(context_messages, g)])
+        # Collect the memories referenced by context messages once, so each goal and memory is checked with a set lookup
+        # rather than a scan of every context message.
+        in_context_keys = pipe(
+            context_messages,
+            map(lambda m: m.memory_metadata),
+            filter(lambda m: m is not None),
+            concat,
+            map(lambda m: (m.memory_type, m.id)),
+            set,
+        )
+
+        in_context_goal_names = {g.get_name() for g in goals if (Goal.__name__, g.id) in in_context_keys}
         non_context_goal_names = sorted([g.get_name() for g in goals if g.get_name() not in in_context_goal_names])
 
-        in_context_memories = sorted([m.get_name() for m in memories if is_memory_in_context(context_messages, m)])
+        in_context_memories = {m.get_name() for m in memories if (Memory.__name__, m.id) in in_context_keys}
         non_context_memories = sorted([m.get_name() for m in memories if m.get_name() not in in_context_memories])
 
         self.prompt_session.completer = pipe(  # type: ignore
             concatv(
-                product(IN_CONTEXT_GOAL_COMMANDS, in_context_goal_names),
+                product(IN_CONTEXT_GOAL_COMMANDS, sorted(in_context_goal_names)),
                 product(NON_CONTEXT_GOAL_COMMANDS, non_context_goal_names),
                 product(ALL_ACTIVE_GOAL_COMMANDS, [g.get_name() for g in goals]),
-                product(IN_CONTEXT_MEMORY_COMMANDS, in_context_memories),
+                product(IN_CONTEXT_MEMORY_COMMANDS, sorted(in_context_memories)),
                 product(NON_CONTEXT_MEMORY_COMMANDS, non_context_memories),
                 product(ALL_ACTIVE_MEMORY_COMMANDS, [m.get_name() for m in memories]),
             ),
@@ -1,13 +1,15 @@
 import json
 import logging
+import time
 from dataclasses import asdict, dataclass
-from typing import Any, Dict, Iterator, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Union
 
 from toolz import dissoc, pipe
 from toolz.curried import keyfilter, map
 
 from ..config.config import ChatModel, EmbeddingModel
 from ..config.constants import (
+    FAILED_MODEL_COOLDOWN_SECONDS,
     MAX_CHAT_COMPLETION_RETRY_COUNT,
     SYSTEM,
     USER,
@@ -20,6 +22,17 @@ from ..db.db_models import ASSISTANT, FunctionCall
 from ..repository.data_models import ContentItem, ContextMessage
 from ..utils.utils import logged_exec_time
 
+if TYPE_CHECKING:
+    from litellm.types.utils import ChatCompletionDeltaToolCall
+
+# Model name -> time.monotonic() of its most recent rate limit or internal server error
+MODEL_FAILED_AT: Dict[str, float] = {}
+
+
+def is_model_cooling_down(chat_model: ChatModel) -> bool:
+    failed_at = MODEL_FAILED_AT.get(chat_model.name)
+    return failed_at is not None and time.monotonic() - failed_at < FAILED_MODEL_COOLDOWN_SECONDS
+
 
 @logged_exec_time
 def generate_chat_completion_message(
@@ -54,26 +67,15 @@ def generate_chat_completion_message(
         else:
             raise ValueError("Assistant message already the most recent message")
 
-    context_message_dicts = pipe(
-        context_messages,
-        map(asdict),
-        map(keyfilter(lambda k: k not in ("id", "created_at", "memory_metadata", "chat_model"))),
-        map(lambda d: dissoc(d, "tool_calls") if not d.get("tool_calls") else d),
-        list,
-    )
-
-    if chat_model.ensure_alternating_roles:
-        USER_HIDDEN_PREFIX = "[This is a system message, representing internal thought process of the assistant]"
-        for idx, message in enumerate(context_message_dicts):
-            assert isinstance(message, Dict)
-
-            if idx == 0:
-                assert message["role"] == SYSTEM, f"First message must be a system message, but found: " + message["role"]
-
-            if idx != 0 and message["role"] == SYSTEM:
-                message["role"] = USER
-                message["content"] = f"{USER_HIDDEN_PREFIX} {message['content']}"
+    # A model that just failed is likely to fail again, skip straight to its fallback rather than waiting on another error
+    if retry_number < MAX_CHAT_COMPLETION_RETRY_COUNT and is_model_cooling_down(chat_model):
+        fallback_model = get_fallback_model(chat_model)
+        if fallback_model:
+            logging.info(f"Model {chat_model.name} failed recently, using fallback model {fallback_model.name}")
+            yield from generate_chat_completion_message(fallback_model, context_messages, enable_tools, force_tool, retry_number + 1)
+            return
 
+    # Resolve tools before converting messages, so that an invalid tool request fails before any per-message work
     if enable_tools:
         from ..tools.function_caller import get_function_schemas
 
@@ -96,6 +98,26 @@ def generate_chat_completion_message(
             tool_choice = None
             tools = None
 
+    context_message_dicts = pipe(
+        context_messages,
+        map(asdict),
+        map(keyfilter(lambda k: k not in ("id", "created_at", "memory_metadata", "chat_model"))),
+        map(lambda d: dissoc(d, "tool_calls") if not d.get("tool_calls") else d),
+        list,
+    )
+
+    if chat_model.ensure_alternating_roles:
+        USER_HIDDEN_PREFIX = "[This is a system message, representing internal thought process of the assistant]"
+        for idx, message in enumerate(context_message_dicts):
+            assert isinstance(message, Dict)
+
+            if idx == 0:
+                assert message["role"] == SYSTEM, f"First message must be a system message, but found: " + message["role"]
+
+            if idx != 0 and message["role"] == SYSTEM:
+                message["role"] = USER
+                message["content"] = f"{USER_HIDDEN_PREFIX} {message['content']}"
+
     try:
         completion_kwargs = _build_completion_kwargs(
             model=chat_model,
@@ -112,29 +134,25 @@ def generate_chat_completion_message(
             if chunk.choices[0].delta.tool_calls:  # type: ignore
                 yield from tool_call_accumulator.update(chunk.choices[0].delta.tool_calls)  # type: ignore
 
-    except Exception as e:
-        if isinstance(e, BadRequestError):
-            if "An assistant message with 'tool_calls' must be followed by tool messages" in str(e):
-                raise MissingToolCallMessageError
-            else:
-                raise e
-        elif isinstance(e, InternalServerError) or isinstance(e, RateLimitError):
-            if retry_number >= MAX_CHAT_COMPLETION_RETRY_COUNT:
-                raise MaxRetriesExceededError()
-            else:
-                fallback_model = get_fallback_model(chat_model)
-                if fallback_model:
-                    logging.info(
-                        f"Rate limit or internal server error for model {chat_model.name}, falling back to model {fallback_model.name}"
-                    )
-                    yield from generate_chat_completion_message(
-                        fallback_model, context_messages, enable_tools, force_tool, retry_number + 1
-                    )
-                else:
-                    logging.error(f"No fallback model available for {chat_model.name}, aborting")
-                    raise e
+    except BadRequestError as e:
+        if "An assistant message with 'tool_calls' must be followed by tool messages" in str(e):
+            raise MissingToolCallMessageError
         else:
             raise e
+    except (InternalServerError, RateLimitError) as e:
+        MODEL_FAILED_AT[chat_model.name] = time.monotonic()
+        if retry_number >= MAX_CHAT_COMPLETION_RETRY_COUNT:
+            raise MaxRetriesExceededError()
+        else:
+            fallback_model = get_fallback_model(chat_model)
+            if fallback_model:
+                logging.info(
+                    f"Rate limit or internal server error for model {chat_model.name}, falling back to model {fallback_model.name}"
+                )
+                yield from generate_chat_completion_message(fallback_model, context_messages, enable_tools, force_tool, retry_number + 1)
+            else:
+                logging.error(f"No fallback model available for {chat_model.name}, aborting")
+                raise e
 
 
 def query_llm(model: ChatModel, prompt: str, system: str) -> str:
@@ -231,14 +249,12 @@ def _query_llm(model: ChatModel, prompt: str, system: str) -> str:
 
 
 class ToolCallAccumulator:
-    from litellm.types.utils import ChatCompletionDeltaToolCall
-
     def __init__(self, chat_model: ChatModel):
         self.chat_model = chat_model
         self.tool_calls: Dict[int, PartialToolCall] = {}
         self.last_updated_index: Optional[int] = None
 
-    def update(self, delta_tool_calls: Optional[List[ChatCompletionDeltaToolCall]]) -> Iterator[FunctionCall]:
+    def update(self, delta_tool_calls: Optional[List["ChatCompletionDeltaToolCall"]]) -> Iterator[FunctionCall]:
         for delta in delta_tool_calls or []:
             if delta.index not in self.tool_calls:
                 if (
@@ -267,9 +283,7 @@ class PartialToolCall:
     type: str = "function"
     is_complete: bool = False
 
-    from litellm.types.utils import ChatCompletionDeltaToolCall
-
-    def update(self, delta: ChatCompletionDeltaToolCall) -> Optional[FunctionCall]:
+    def update(self, delta: "ChatCompletionDeltaToolCall") -> Optional[FunctionCall]:
         from litellm.types.utils import ChatCompletionDeltaToolCall
 
         if self.is_complete:
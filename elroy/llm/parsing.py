@@ -2,6 +2,8 @@ import logging
 import re
 from typing import Tuple
 
+MARKDOWN_TITLE_PATTERN = re.compile(r"^#+\s*(.+)$")
+
 
 def extract_title_and_body(response: str) -> Tuple[str, str]:
     """Extract title and body from markdown formatted response.
@@ -31,7 +33,7 @@ def extract_title_and_body(response: str) -> Tuple[str, str]:
 
     # Match any number of #s followed by optional space and title text
 
-    title_match = re.match(r"^#+\s*(.+)$", title_line)
+    title_match = MARKDOWN_TITLE_PATTERN.match(title_line)
 
     if not title_match:
         logging.info("No title Markdown formatting found for title, accepting first line as title.")
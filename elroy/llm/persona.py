@@ -14,7 +14,9 @@ def get_persona(ctx: ElroyContext):
         user_noun = user_preference.preferred_name
     else:
         user_noun = "my user"
-    return raw_persona.replace(USER_ALIAS_STRING, user_noun).replace(ASSISTANT_ALIAS_STRING, get_assistant_name(ctx))
+    # Resolve the assistant name from the preference already in hand, rather than fetching it again via get_assistant_name
+    assistant_name = user_preference.assistant_name or ctx.default_assistant_name
+    return raw_persona.replace(USER_ALIAS_STRING, user_noun).replace(ASSISTANT_ALIAS_STRING, assistant_name)
 
 
 def get_assistant_name(ctx: ElroyContext) -> str:
@@ -1,4 +1,4 @@
-from functools import partial
+from functools import lru_cache, partial
 from typing import Optional, Tuple
 
 from ..config.config import ChatModel
@@ -33,13 +33,12 @@ Only output the summary, do NOT include anything else in your output.
 )
 
 
-async def summarize_for_memory(model: ChatModel, conversation_summary: str, user_preferred_name: Optional[str]) -> Tuple[str, str]:
+@lru_cache(maxsize=None)
+def memory_formation_prompt(user_preferred_name: Optional[str]) -> str:
+    # Only varies by user name, so the same string is reused for every memory formed for a user
     user_noun = user_preferred_name or "the user"
 
-    response = query_llm(
-        model=model,
-        prompt=conversation_summary,
-        system=f"""
+    return f"""
 You are the internal thought monologue of an AI personal assistant, forming a memory from a conversation.
 
 Given a conversation summary, your will reflect on the conversation and decide which memories might be relevant in future interactions with {user_preferred_name}.
@@ -63,7 +62,14 @@ An example response might look like this:
 # Exercise progress on 2021-01-01
 Today, {user_noun} went for a 5 mile run. They plan to run a marathon in the spring.
 
-""",
+"""
+
+
+async def summarize_for_memory(model: ChatModel, conversation_summary: str, user_preferred_name: Optional[str]) -> Tuple[str, str]:
+    response = query_llm(
+        model=model,
+        prompt=conversation_summary,
+        system=memory_formation_prompt(user_preferred_name),
     )
 
     return extract_title_and_body(response)
@@ -1,11 +1,13 @@
 import logging
 import os
+from functools import lru_cache
 from logging.handlers import RotatingFileHandler
 
-import litellm
-
 
+@lru_cache(maxsize=1)
 def setup_logging(log_file_path: str):
+    import litellm
+
     # Create the directory for the log file if it doesn't exist
     os.makedirs(os.path.dirname(log_file_path), exist_ok=True)
 
@@ -35,6 +37,8 @@ def setup_logging(log_file_path: str):
         litellm.verbose_logger.removeHandler(handler)  # type: ignore
         litellm.verbose_logger.addHandler(file_handler)  # type: ignore
 
-    # Disable propagation to the root logger for all loggers
-    for name in logging.root.manager.loggerDict:
-        logging.getLogger(name).propagate = False
+    # Disable propagation to the root logger for all loggers. Placeholders (dotted name prefixes with no logger of their
+    # own) are skipped, rather than being materialized via getLogger.
+    for logger in list(logging.root.manager.loggerDict.values()):
+        if isinstance(logger, logging.Logger):
+            logger.propagate = False
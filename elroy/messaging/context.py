@@ -29,10 +29,12 @@ from ..repository.message import (
     get_context_messages,
     get_time_since_context_message_creation,
     is_system_instruction,
-    remove_context_messages,
     replace_context_messages,
 )
-from ..tools.user_preferences import get_or_create_user_preference
+from ..tools.user_preferences import (
+    get_or_create_user_preference,
+    get_user_preferred_name,
+)
 from ..utils.clock import get_utc_now
 from ..utils.utils import datetime_to_string, logged_exec_time
 
@@ -166,6 +168,9 @@ def compress_context_messages(ctx: ElroyContext, context_messages: List[ContextM
 
     kept_messages = deque()
 
+    # messages created before this cutoff are too stale to keep; computed once rather than per message
+    min_created_at = get_utc_now() - ctx.max_in_context_message_age
+
     # iterate through non-system context messages in reverse order
     # we keep the most current messages that are fresh enough to be relevant
     for msg in reversed(prev_messages):  # iterate in reverse order
@@ -182,7 +187,7 @@ def compress_context_messages(ctx: ElroyContext, context_messages: List[ContextM
 
         if current_token_count > ctx.context_refresh_target_tokens:
             break
-        elif msg_created_at < get_utc_now() - ctx.max_in_context_message_age:
+        elif msg_created_at < min_created_at:
             logging.info(f"Dropping old message {msg.id}")
             continue
         else:
@@ -230,7 +235,6 @@ def replace_system_instruction(context_messages: List[ContextMessage], new_syste
 @logged_exec_time
 async def context_refresh(ctx: ElroyContext) -> None:
     from ..repository.memory import create_memory, formulate_memory
-    from ..tools.user_preferences import get_user_preferred_name
 
     context_messages = get_context_messages(ctx)
     user_preferred_name = get_user_preferred_name(ctx)
@@ -261,11 +265,12 @@ def is_memory_in_context_message(memory: EmbeddableSqlModel, context_message: Co
 
 
 def remove_from_context(ctx: ElroyContext, memory: EmbeddableSqlModel):
+    # Filter the context messages in hand, rather than looking the current context up a second time
     pipe(
         get_context_messages(ctx),
-        filter(partial(is_memory_in_context_message, memory)),
+        remove(partial(is_memory_in_context_message, memory)),
         list,
-        partial(remove_context_messages, ctx),
+        partial(replace_context_messages, ctx),
     )
 
 
@@ -25,7 +25,7 @@ from ..repository.message import (
 )
 from ..tools.function_caller import FunctionCall, exec_function_call
 from ..utils.utils import last_or_none, logged_exec_time
-from .context import get_refreshed_system_message
+from .context import get_refreshed_system_message, is_memory_in_context
 
 
 def process_message(role: str, ctx: ElroyContext, msg: str, force_tool: Optional[str] = None) -> Iterator[str]:
@@ -200,8 +200,6 @@ def _has_assistant_tool_call(tool_call_id: Optional[str], context_messages: List
 
 @logged_exec_time
 def get_relevant_memories(ctx: ElroyContext, context_messages: List[ContextMessage]) -> List[ContextMessage]:
-    from .context import is_memory_in_context
-
     message_content = pipe(
         context_messages,
         remove(lambda x: x.role == SYSTEM),
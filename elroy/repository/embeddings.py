@@ -5,6 +5,7 @@ from typing import Iterable, List, Type
 
 from toolz import compose
 
+from ..config.constants import RESULT_SET_LIMIT_COUNT
 from ..config.ctx import ElroyContext
 from ..db.db_models import EmbeddableSqlModel, Goal, Memory
 from ..utils.utils import first_or_none
@@ -14,6 +15,7 @@ def query_vector(
     table: Type[EmbeddableSqlModel],
     ctx: ElroyContext,
     query: List[float],
+    limit: int = RESULT_SET_LIMIT_COUNT,
 ) -> Iterable[EmbeddableSqlModel]:
     """
     Perform a vector search on the specified table using the given query.
@@ -21,6 +23,7 @@ def query_vector(
     Args:
         query (str): The search query.
         table (EmbeddableSqlModel): The SQLModel table to search.
+        limit (int): The maximum number of rows to return.
 
     Returns:
         List[Tuple[Fact, float]]: A list of tuples containing the matching Fact and its similarity score.
@@ -31,11 +34,13 @@ def query_vector(
         table,
         ctx.user_id,
         query,
+        limit,
     )
 
 
-get_most_relevant_goal = compose(first_or_none, partial(query_vector, Goal))
-get_most_relevant_memory = compose(first_or_none, partial(query_vector, Memory))
+# Only the closest match is used, so only one row is fetched and hydrated
+get_most_relevant_goal = compose(first_or_none, partial(query_vector, Goal, limit=1))
+get_most_relevant_memory = compose(first_or_none, partial(query_vector, Memory, limit=1))
 
 
 def upsert_embedding_if_needed(ctx: ElroyContext, row: EmbeddableSqlModel) -> None:
@@ -44,15 +49,15 @@ def upsert_embedding_if_needed(ctx: ElroyContext, row: EmbeddableSqlModel) -> No
     new_text = row.to_fact()
     new_md5 = hashlib.md5(new_text.encode()).hexdigest()
 
-    # Check if vector storage exists for this row
-    vector_storage_row = ctx.db.get_vector_storage_row(row)
+    # Only the stored md5 is needed to decide, the stored embedding itself is never read
+    stored_md5 = ctx.db.get_embedding_text_md5(row)
 
-    if vector_storage_row and vector_storage_row.embedding_text_md5 == new_md5:
+    if stored_md5 == new_md5:
         logging.info("Old and new text matches md5, skipping")
         return
     else:
         embedding = get_embedding(ctx.embedding_model, new_text)
-        if vector_storage_row:
-            ctx.db.update_embedding(vector_storage_row, embedding, new_md5)
+        if stored_md5:
+            ctx.db.update_embedding(row, embedding, new_md5)
         else:
             ctx.db.insert_embedding(row=row, embedding_data=embedding, embedding_text_md5=new_md5)
@@ -177,9 +177,10 @@ def _update_goal_status(ctx: ElroyContext, goal_name: str, is_terminal: bool, st
     if status:
         assert status in goal.status_updates, "Status update not found in goal status updates"
 
-    upsert_embedding_if_needed(ctx, goal)
-
-    if not goal.is_active:
+    # Inactive goals are excluded from vector search, so a terminal update only needs the is_active change, not a new embedding
+    if goal.is_active:
+        upsert_embedding_if_needed(ctx, goal)
+    else:
         remove_from_context(ctx, goal)
 
 
@@ -1,6 +1,7 @@
 import logging
 from typing import List, Optional, Tuple
 
+from sqlalchemy.orm import load_only
 from sqlmodel import select
 
 from ..config.config import ChatModel
@@ -9,6 +10,7 @@ from ..config.ctx import ElroyContext
 from ..db.db_models import Memory
 from ..llm.client import query_llm
 from .data_models import ContextMessage
+from .embeddings import upsert_embedding_if_needed
 
 MAX_MEMORY_LENGTH = 12000  # Characters
 
@@ -315,7 +317,6 @@ def create_memory(ctx: ElroyContext, name: str, text: str) -> int:
     ctx.db.add(memory)
     ctx.db.commit()
     ctx.db.refresh(memory)
-    from ..repository.embeddings import upsert_embedding_if_needed
 
     memory_id = memory.id
     assert memory_id
@@ -336,3 +337,17 @@ def get_active_memories(ctx: ElroyContext) -> List[Memory]:
             )
         ).all()
     )
+
+
+def get_active_memories_for_listing(ctx: ElroyContext) -> List[Memory]:
+    """Fetch all active memories for the user, loading only their ids and names. Use get_active_memories if text is needed"""
+    return list(
+        ctx.db.exec(
+            select(Memory)
+            .where(
+                Memory.user_id == ctx.user_id,
+                Memory.is_active == True,
+            )
+            .options(load_only(Memory.id, Memory.name))  # type: ignore
+        ).all()
+    )
@@ -4,8 +4,9 @@ from datetime import timedelta
 from functools import partial
 from typing import Iterable, List, Optional, Union
 
+from sqlalchemy import bindparam
 from sqlmodel import select
-from toolz import first, pipe
+from toolz import first, pipe, unique
 from toolz.curried import filter, map, pipe
 
 from ..config.constants import SYSTEM_INSTRUCTION_LABEL
@@ -22,6 +23,13 @@ from ..utils.clock import ensure_utc, get_utc_now
 from ..utils.utils import last_or_none, logged_exec_time
 from .data_models import ContextMessage
 
+# Built once at import and executed with per-call params, rather than reconstructed on every context read
+CURRENT_CONTEXT_MESSAGE_SET_QUERY = select(ContextMessageSet).where(
+    ContextMessageSet.user_id == bindparam("user_id"),
+    ContextMessageSet.is_active == True,
+)
+MESSAGES_BY_ID_QUERY = select(Message).where(Message.id.in_(bindparam("message_ids", expanding=True)))  # type: ignore
+
 
 # This is hacky, should add arbitrary metadata
 def is_system_instruction(message: Optional[ContextMessage]) -> bool:
@@ -69,12 +77,7 @@ def db_message_to_context_message(db_message: Message) -> ContextMessage:
 
 
 def get_current_context_message_set_db(ctx: ElroyContext) -> Optional[ContextMessageSet]:
-    return ctx.db.exec(
-        select(ContextMessageSet).where(
-            ContextMessageSet.user_id == ctx.user_id,
-            ContextMessageSet.is_active == True,
-        )
-    ).first()
+    return ctx.db.exec(CURRENT_CONTEXT_MESSAGE_SET_QUERY, params={"user_id": ctx.user_id}).first()
 
 
 def get_time_since_context_message_creation(ctx: ElroyContext) -> Optional[timedelta]:
@@ -98,8 +101,9 @@ def _get_context_messages_iter(ctx: ElroyContext) -> Iterable[ContextMessage]:
     assert isinstance(message_ids, list)
 
     return pipe(
-        ctx.db.exec(select(Message).where(Message.id.in_(message_ids))),  # type: ignore
-        lambda messages: sorted(messages, key=lambda m: message_ids.index(m.id)),
+        ctx.db.exec(MESSAGES_BY_ID_QUERY, params={"message_ids": message_ids}),
+        lambda messages: {m.id: m for m in messages},
+        lambda messages_by_id: (messages_by_id[id] for id in unique(message_ids) if id in messages_by_id),
         map(db_message_to_context_message),
     )  # type: ignore
 
@@ -127,25 +131,22 @@ def get_context_messages(ctx: ElroyContext) -> List[ContextMessage]:
 
 
 def persist_messages(ctx: ElroyContext, messages: List[ContextMessage]) -> List[int]:
-    msg_ids = []
+    """
+    Adds any messages that have not yet been persisted to the session, and returns the ids of all messages.
+
+    New messages are flushed together to obtain their ids, the caller is responsible for committing.
+    """
+    db_messages = []
     for msg in messages:
         if msg.id:
-            msg_ids.append(msg.id)
+            db_messages.append(msg)
         else:
             db_message = context_message_to_db_message(ctx.user_id, msg)
             ctx.db.add(db_message)
-            ctx.db.commit()
-            ctx.db.refresh(db_message)
-            msg_ids.append(db_message.id)
-    return msg_ids
-
-
-def remove_context_messages(ctx: ElroyContext, messages: List[ContextMessage]) -> None:
-    assert all(m.id is not None for m in messages), "All messages must have an id to be removed"
-
-    msg_ids = [m.id for m in messages]
+            db_messages.append(db_message)
 
-    replace_context_messages(ctx, [m for m in get_context_messages(ctx) if m.id not in msg_ids])
+    ctx.db.flush()
+    return [m.id for m in db_messages]  # type: ignore
 
 
 def add_context_messages(ctx: ElroyContext, messages: Union[ContextMessage, List[ContextMessage]]) -> None:
@@ -160,12 +161,7 @@ def add_context_messages(ctx: ElroyContext, messages: Union[ContextMessage, List
 def replace_context_messages(ctx: ElroyContext, messages: List[ContextMessage]) -> None:
     msg_ids = persist_messages(ctx, messages)
 
-    existing_context = ctx.db.exec(
-        select(ContextMessageSet).where(
-            ContextMessageSet.user_id == ctx.user_id,
-            ContextMessageSet.is_active == True,
-        )
-    ).first()
+    existing_context = get_current_context_message_set_db(ctx)
 
     if existing_context:
         existing_context.is_active = None
@@ -102,7 +102,7 @@ def help(ctx: ElroyContext) -> None:
             map(
                 lambda f: (
                     f.__name__,
-                    inspect.getdoc(f).split("\n")[0],  # type: ignore
+                    inspect.getdoc(f).partition("\n")[0],  # type: ignore
                 )
             ),
             list,
@@ -119,8 +119,7 @@ def help(ctx: ElroyContext) -> None:
         ctx.io.print(table)
     else:
         # not really expecting to use this function outside of CLI, but just in case
-        for f in SYSTEM_COMMANDS:
-            ctx.io.print(f.__name__)
+        ctx.io.print("\n".join(f.__name__ for f in SYSTEM_COMMANDS))
 
 
 def add_internal_thought(ctx: ElroyContext, thought: str) -> str:
@@ -349,3 +348,5 @@ USER_ONLY_COMMANDS = {
 
 
 SYSTEM_COMMANDS = ASSISTANT_VISIBLE_COMMANDS | USER_ONLY_COMMANDS
+
+SYSTEM_COMMAND_NAMES = frozenset(f.__name__ for f in SYSTEM_COMMANDS)
@@ -3,11 +3,12 @@ import platform
 import sys
 import urllib.parse
 import webbrowser
+from collections import deque
 from datetime import datetime
+from functools import lru_cache
 from pprint import pformat
-from typing import Optional
+from typing import Optional, Tuple
 
-import scrubadub
 from toolz import pipe
 from toolz.curried import keyfilter
 
@@ -29,7 +30,8 @@ def tail_elroy_logs(ctx: ElroyContext, lines: int = 10) -> str:
         str: The last `lines` of the Elroy logs
     """
     with open(ctx.log_file_path, "r") as f:
-        return "".join(f.readlines()[-lines:])
+        # Stream the file, only holding on to the last `lines` lines rather than the whole log
+        return "".join(deque(f, maxlen=lines))
 
 
 def print_elroy_config(ctx: ElroyContext) -> str:
@@ -46,11 +48,22 @@ def print_elroy_config(ctx: ElroyContext) -> str:
     return pipe(
         vars(ctx),
         # lambda d: obscure_sensitive_info(d) if scrub else d,
-        keyfilter(lambda k: not k.startswith("_")),
+        keyfilter(lambda k: not k.startswith("_") and k != "db"),
         lambda x: pformat(x, indent=2, width=80),
     )  # type: ignore
 
 
+@lru_cache(maxsize=1)
+def get_system_info() -> Tuple[str, ...]:
+    """Bug report system information section, which does not change over the life of the process"""
+    return (
+        "\n## System Information",
+        f"OS: {platform.system()} {platform.release()}",
+        f"Python: {sys.version}",
+        f"Elroy Version: {__version__}",
+    )
+
+
 def create_bug_report(
     ctx: ElroyContext,
     title: str,
@@ -73,14 +86,7 @@ def create_bug_report(
     ]
 
     # Add system information
-    report.extend(
-        [
-            "\n## System Information",
-            f"OS: {platform.system()} {platform.release()}",
-            f"Python: {sys.version}",
-            f"Elroy Version: {__version__}",
-        ]
-    )
+    report.extend(get_system_info())
 
     report.append(f"\n## Recent Logs (last {BUG_REPORT_LOG_LINES} lines)")
     try:
@@ -91,6 +97,9 @@ def create_bug_report(
     except Exception as e:
         report.append(f"Error fetching logs: {str(e)}")
 
+    # scrubadub is slow to import, and is only needed on this error reporting path
+    import scrubadub
+
     # Combine the report
     full_report = scrubadub.clean("\n".join(report))
 
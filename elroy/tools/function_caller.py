@@ -1,6 +1,7 @@
 import inspect
 import traceback
 from dataclasses import dataclass
+from functools import lru_cache
 from types import FunctionType, ModuleType
 from typing import (
     Any,
@@ -18,6 +19,7 @@ from docstring_parser import parse
 from toolz import concat, concatv, merge, pipe
 from toolz.curried import do, filter, map, remove
 
+from ..config.constants import TOOL_ERROR_TRACEBACK_FRAMES
 from ..config.ctx import ElroyContext
 from ..db.db_models import FunctionCall
 from ..utils.utils import first_or_none
@@ -69,8 +71,9 @@ def exec_function_call(ctx: ElroyContext, function_call: FunctionCall) -> str:
         )  # type: ignore
 
     except Exception as e:
+        tb = "".join(traceback.TracebackException.from_exception(e, limit=-TOOL_ERROR_TRACEBACK_FRAMES).format())
         return pipe(
-            f"Failed function call:\n{function_call}\n\n" + "".join(traceback.format_exception(type(e), e, e.__traceback__)),
+            f"Failed function call:\n{function_call}\n\n{tb}",
             do(ctx.io.notify_warning),
             ERROR_PREFIX.__add__,
         )
@@ -180,11 +183,21 @@ def get_function_schema(function: FunctionType) -> Dict:
 
 
 def get_function_schemas() -> List[Dict[str, Any]]:
+    return list(_get_validated_function_schemas())
+
+
+@lru_cache(maxsize=1)
+def _get_validated_function_schemas() -> List[Dict[str, Any]]:
+    """
+    Builds and validates function schemas on first use, rather than at import time.
+    The set of available functions is fixed for the lifetime of the process.
+    """
     return pipe(
         get_functions().values(),
         map(get_function_schema),
         map(lambda _: {"type": "function", "function": _}),
         list,
+        do(validate_openai_tool_schema),
     )  # type: ignore
 
 
@@ -205,7 +218,7 @@ def get_functions() -> Dict[str, FunctionType]:
     )
 
 
-def validate_openai_tool_schema():
+def validate_openai_tool_schema(function_schemas: List[Dict[str, Any]]):
     """
     Validates the schema for OpenAI function tools' parameters.
 
@@ -215,8 +228,6 @@ def validate_openai_tool_schema():
     """
     errors = []
 
-    function_schemas = get_function_schemas()
-
     if not isinstance(function_schemas, list):
         errors.append("Function schemas should be a list.")
         return False, errors
@@ -257,6 +268,3 @@ def validate_openai_tool_schema():
 
     if len(errors) > 0:
         raise ValueError(errors)
-
-
-validate_openai_tool_schema()
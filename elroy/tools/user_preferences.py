@@ -2,6 +2,7 @@ import logging
 from typing import Optional
 
 import typer
+from sqlmodel import select
 from toolz import do
 
 from ..config.constants import UNKNOWN
@@ -137,8 +138,6 @@ def get_user_full_name(ctx: ElroyContext) -> str:
 
 
 def get_or_create_user_preference(ctx: ElroyContext) -> UserPreference:
-    from sqlmodel import select
-
     user_preference = ctx.db.exec(
         select(UserPreference).where(
             UserPreference.user_id == ctx.user_id,
@@ -1,4 +1,5 @@
 import logging
+import queue
 import threading
 import time
 from datetime import datetime
@@ -26,16 +27,20 @@ def is_blank(input: Optional[str]) -> bool:
 
 def logged_exec_time(func, name: Optional[str] = None):
     def wrapper(*args, **kwargs):
-        start_time = time.time()
+        # Timing is only reported at debug level, so skip the clock reads and formatting otherwise
+        if not logging.getLogger().isEnabledFor(logging.DEBUG):
+            return func(*args, **kwargs)
+
+        start_time = time.perf_counter()
         result = func(*args, **kwargs)
-        elapsed_time = time.time() - start_time
+        elapsed_time = time.perf_counter() - start_time
 
         if name:
             func_name = name
         else:
             func_name = func.__name__ if not isinstance(func, partial) else func.func.__name__
 
-        logging.info(f"Function '{func_name}' executed in {elapsed_time:.4f} seconds")
+        logging.debug(f"Function '{func_name}' executed in {elapsed_time:.4f} seconds")
         return result
 
     return wrapper
@@ -84,18 +89,63 @@ def obscure_sensitive_info(d: Dict[str, Any]) -> Dict[str, Any]:
     return result
 
 
+def _with_thread_db(fn: Callable, ctx: ElroyContext, *args, on_complete: Optional[Callable[[], None]] = None) -> Callable[[], None]:
+    db = ctx.db
+
+    def _run_with_thread_db():
+        # The session is opened on the thread that uses it, and closed once fn completes
+        try:
+            with db.get_new_session() as thread_db:
+                fn(clone_ctx_with_db(ctx, thread_db), *args)
+        finally:
+            # Runs even if the session could not be opened, in which case fn never ran
+            if on_complete:
+                on_complete()
+
+    return _run_with_thread_db
+
+
 def run_in_background_thread(fn: Callable, ctx: ElroyContext, *args):
-    from ..config.ctx import ElroyContext
+    """
+    Runs fn on a dedicated daemon thread. Intended for long running work, short tasks should use queue_background_task
+    """
+    assert isinstance(ctx, ElroyContext)
+
+    thread = threading.Thread(
+        target=_with_thread_db(fn, ctx, *args),
+        daemon=True,
+    )
+    thread.start()
+
+
+BACKGROUND_TASK_QUEUE: "queue.SimpleQueue[Callable[[], None]]" = queue.SimpleQueue()
+_background_worker: Optional[threading.Thread] = None
+_background_worker_lock = threading.Lock()
+
+
+def _drain_background_tasks():
+    while True:
+        task = BACKGROUND_TASK_QUEUE.get()
+        try:
+            task()
+        except Exception:
+            # Keep the worker alive for subsequent tasks
+            logging.exception("Error in background task")
+
+
+def queue_background_task(fn: Callable, ctx: ElroyContext, *args, on_complete: Optional[Callable[[], None]] = None):
+    """
+    Runs fn on a single, long lived background worker, rather than starting a thread per task. Tasks run in the order queued.
+
+    on_complete is called once the task is finished, whether or not it succeeded.
+    """
+    global _background_worker
 
     assert isinstance(ctx, ElroyContext)
 
-    # hack to get a new session for the thread
-    with ctx.db.get_new_session() as db:
-        new_ctx = clone_ctx_with_db(ctx, db)
+    with _background_worker_lock:
+        if _background_worker is None:
+            _background_worker = threading.Thread(target=_drain_background_tasks, name="elroy-background-worker", daemon=True)
+            _background_worker.start()
 
-        thread = threading.Thread(
-            target=fn,
-            args=(new_ctx, *args),
-            daemon=True,
-        )
-        thread.start()
+    BACKGROUND_TASK_QUEUE.put(_with_thread_db(fn, ctx, *args, on_complete=on_complete))
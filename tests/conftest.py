@@ -20,6 +20,7 @@ from elroy.db.db_models import ContextMessageSet, Goal, Memory, User, UserPrefer
 from elroy.db.postgres.postgres_manager import PostgresManager
 from elroy.db.sqlite.sqlite_manager import SqliteManager
 from elroy.io.base import ElroyIO
+from elroy.llm.client import MODEL_FAILED_AT
 from elroy.repository.goals.operations import create_goal
 from elroy.repository.message import ContextMessage, Message, add_context_messages
 from elroy.repository.user import create_user_id
@@ -98,6 +99,13 @@ def db(
             yield db
 
 
+@pytest.fixture(autouse=True)
+def clear_failed_models():
+    # A model failure recorded by one test would otherwise send later tests to the fallback model
+    yield
+    MODEL_FAILED_AT.clear()
+
+
 @pytest.fixture(scope="function")
 def user_id(db, user_token) -> Generator[int, Any, None]:
     yield create_user_id(db, user_token)
@@ -1,7 +1,16 @@
+import time
+from typing import List
+
 from litellm.types.utils import Delta, ModelResponse, StreamingChoices
 
+from elroy.config.constants import MAX_CHAT_COMPLETION_RETRY_COUNT
 from elroy.config.ctx import ElroyContext
-from elroy.llm.client import generate_chat_completion_message, query_llm
+from elroy.config.models import get_fallback_model
+from elroy.llm.client import (
+    MODEL_FAILED_AT,
+    generate_chat_completion_message,
+    query_llm,
+)
 from elroy.repository.data_models import ContextMessage
 
 
@@ -38,3 +47,50 @@ def test_model_fallback(ctx: ElroyContext, mocker):
 
     # First call should use gpt-4
     assert mock_completion.call_args_list[0].kwargs["model"] != mock_completion.call_args_list[1].kwargs["model"]
+
+
+def _hello_messages(ctx: ElroyContext) -> List[ContextMessage]:
+    return [
+        ContextMessage(role="system", content="You are a test assistant", chat_model=ctx.chat_model.name),
+        ContextMessage(role="user", content="Say hello", chat_model=ctx.chat_model.name),
+    ]
+
+
+def test_cooling_down_model_uses_fallback(ctx: ElroyContext, mocker):
+    mock_completion = mocker.patch("litellm.completion", return_value=iter([]))
+    mocker.patch.dict(MODEL_FAILED_AT, {ctx.chat_model.name: time.monotonic()})
+
+    list(generate_chat_completion_message(ctx.chat_model, _hello_messages(ctx), enable_tools=False))
+
+    # The model that just failed is skipped without being called
+    fallback_model = get_fallback_model(ctx.chat_model)
+    assert fallback_model
+    assert mock_completion.call_count == 1
+    assert mock_completion.call_args.kwargs["model"] == fallback_model.name
+
+
+def test_cooling_down_model_used_at_retry_limit(ctx: ElroyContext, mocker):
+    mock_completion = mocker.patch("litellm.completion", return_value=iter([]))
+    mocker.patch.dict(MODEL_FAILED_AT, {ctx.chat_model.name: time.monotonic()})
+
+    list(
+        generate_chat_completion_message(
+            ctx.chat_model, _hello_messages(ctx), enable_tools=False, retry_number=MAX_CHAT_COMPLETION_RETRY_COUNT
+        )
+    )
+
+    assert mock_completion.call_count == 1
+    assert mock_completion.call_args.kwargs["model"] == ctx.chat_model.name
+
+
+def test_cooling_down_model_without_fallback_is_used(ctx: ElroyContext, mocker):
+    chat_model = ctx.chat_model._replace(name="elroy-test-unknown-model")
+    assert get_fallback_model(chat_model) is None
+
+    mock_completion = mocker.patch("litellm.completion", return_value=iter([]))
+    mocker.patch.dict(MODEL_FAILED_AT, {chat_model.name: time.monotonic()})
+
+    list(generate_chat_completion_message(chat_model, _hello_messages(ctx), enable_tools=False))
+
+    assert mock_completion.call_count == 1
+    assert mock_completion.call_args.kwargs["model"] == chat_model.name
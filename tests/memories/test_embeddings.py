@@ -1,7 +1,11 @@
+import pytest
+from sqlalchemy import text
 from sqlmodel import desc, select
 from tests.utils import process_test_message
 
+from elroy.config.constants import EMBEDDING_SIZE
 from elroy.db.db_models import Goal
+from elroy.repository.embeddings import upsert_embedding_if_needed
 
 
 def test_embeddings(george_ctx):
@@ -20,3 +24,34 @@ def test_embeddings(george_ctx):
 
     assert george_ctx.db.get_embedding(goal) is not None, "Embedding was not created for the goal"
     assert george_ctx.db.get_embedding_text_md5(goal) is not None, "Embedding text MD5 was not created for the goal"
+
+
+def test_upsert_embedding_skips_unchanged_text_and_updates_changed_text_in_place(ctx, mocker):
+    goal = Goal(user_id=ctx.user_id, name="Learn the banjo", description="Practice every evening")  # type: ignore
+    ctx.db.add(goal)
+    ctx.db.commit()
+    ctx.db.refresh(goal)
+
+    get_embedding = mocker.patch("elroy.llm.client.get_embedding", return_value=[0.1] * EMBEDDING_SIZE)
+    upsert_embedding_if_needed(ctx, goal)
+    original_md5 = ctx.db.get_embedding_text_md5(goal)
+    assert get_embedding.call_count == 1
+
+    # Unchanged text matches the stored md5, so no embedding is requested
+    upsert_embedding_if_needed(ctx, goal)
+    assert get_embedding.call_count == 1
+
+    goal.description = "Practice every morning"
+    ctx.db.commit()
+    get_embedding.return_value = [0.2] * EMBEDDING_SIZE
+    upsert_embedding_if_needed(ctx, goal)
+
+    assert get_embedding.call_count == 2
+    assert ctx.db.get_embedding_text_md5(goal) != original_md5
+    assert ctx.db.get_embedding(goal) == pytest.approx([0.2] * EMBEDDING_SIZE)
+    vector_count = ctx.db.exec(
+        text("SELECT COUNT(*) FROM vectorstorage WHERE source_type = :source_type AND source_id = :source_id").bindparams(
+            source_type=Goal.__name__, source_id=goal.id
+        )
+    ).one()[0]
+    assert vector_count == 1, "Changed text should update the existing embedding row, not add another"
@@ -1,6 +1,10 @@
 from tests.utils import process_test_message, quiz_assistant_bool
 
-from elroy.repository.goals.operations import create_goal
+from elroy.repository.goals.operations import (
+    create_goal,
+    delete_goal_permanently,
+    mark_goal_completed,
+)
 from elroy.repository.goals.queries import get_active_goals_summary
 from elroy.system_commands import reset_messages
 
@@ -62,3 +66,15 @@ def test_goal_update_goal_slight_difference(ctx):
     )
 
     assert "4 miles" in get_active_goals_summary(ctx)
+
+
+def test_terminal_goal_updates_are_not_re_embedded(ctx, mocker):
+    upsert_embedding = mocker.patch("elroy.repository.goals.operations.upsert_embedding_if_needed")
+    create_goal(ctx, "Paint the fence")
+    create_goal(ctx, "Repaint the shed")
+    upsert_embedding.reset_mock()
+
+    mark_goal_completed(ctx, "Paint the fence", "Finished the last coat")
+    delete_goal_permanently(ctx, "Repaint the shed")
+
+    upsert_embedding.assert_not_called()
@@ -0,0 +1,40 @@
+import json
+
+from sqlmodel import select
+
+from elroy.config.constants import USER
+from elroy.db.db_models import Message
+from elroy.repository.message import (
+    ContextMessage,
+    get_context_messages,
+    get_current_context_message_set_db,
+    persist_messages,
+    replace_context_messages,
+)
+
+
+def test_persist_messages_returns_ids_before_commit(ctx):
+    messages = [ContextMessage(role=USER, content=f"Uncommitted message {i}", chat_model=None) for i in range(3)]
+
+    msg_ids = persist_messages(ctx, messages)
+
+    assert len(msg_ids) == 3
+    assert all(msg_id is not None for msg_id in msg_ids)
+    assert len(set(msg_ids)) == 3
+
+    # The ids come from a flush, so the rows are visible in the open transaction but go away on rollback
+    assert len(ctx.db.exec(select(Message).where(Message.id.in_(msg_ids))).all()) == 3  # type: ignore
+    ctx.db.rollback()
+    assert ctx.db.exec(select(Message).where(Message.id.in_(msg_ids))).all() == []  # type: ignore
+
+
+def test_get_context_messages_dedupes_ids_in_first_occurrence_order(ctx):
+    replace_context_messages(ctx, [ContextMessage(role=USER, content=f"Context message {i}", chat_model=None) for i in range(3)])
+    first_id, second_id, third_id = [msg.id for msg in get_context_messages(ctx)]
+
+    context_message_set = get_current_context_message_set_db(ctx)
+    assert context_message_set
+    context_message_set.message_ids = json.dumps([second_id, first_id, second_id, third_id, first_id])
+    ctx.db.commit()
+
+    assert [msg.id for msg in get_context_messages(ctx)] == [second_id, first_id, third_id]
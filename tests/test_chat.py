@@ -0,0 +1,48 @@
+import threading
+
+from elroy.cli.chat import contemplate_in_background, get_contemplate_lock
+from elroy.config.ctx import ElroyContext
+
+
+def test_contemplate_lock_released_when_session_fails(ctx: ElroyContext, monkeypatch):
+    def failing_session():
+        raise RuntimeError("Could not open session")
+
+    monkeypatch.setattr(ctx.db, "get_new_session", failing_session)
+
+    contemplate_in_background(ctx)
+
+    # The session is opened on the background worker, wait for it to hand the lock back
+    lock = get_contemplate_lock(ctx.user_id)
+    assert lock.acquire(timeout=5), "Contemplation lock still held after the background session failed to open"
+    lock.release()
+
+
+def test_contemplations_requested_while_running_get_one_follow_up(ctx: ElroyContext, monkeypatch):
+    from elroy.cli import chat
+
+    calls = []
+    first_started = threading.Event()
+    finish_first = threading.Event()
+
+    def slow_contemplate(ctx: ElroyContext) -> None:
+        calls.append(ctx.user_id)
+        if len(calls) == 1:
+            first_started.set()
+            finish_first.wait(timeout=5)
+
+    monkeypatch.setattr(chat, "contemplate", slow_contemplate)
+
+    contemplate_in_background(ctx)
+    assert first_started.wait(timeout=5)
+
+    # Both requests arrive while the first contemplation is running, and are coalesced into a single follow-up
+    contemplate_in_background(ctx)
+    contemplate_in_background(ctx)
+    finish_first.set()
+
+    lock = get_contemplate_lock(ctx.user_id)
+    assert lock.acquire(timeout=5), "Contemplation lock still held after the follow-up finished"
+    lock.release()
+
+    assert len(calls) == 2
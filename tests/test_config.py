@@ -5,7 +5,13 @@ import pytest
 from typer.testing import CliRunner
 
 from elroy.cli.main import MODEL_ALIASES, app, common
-from elroy.config.config import DEFAULTS_CONFIG
+from elroy.config.config import DEFAULTS_CONFIG, get_chat_model
+from elroy.config.models import (
+    OPENAI,
+    get_fallback_model,
+    get_provider,
+    get_supported_openai_models,
+)
 
 
 @pytest.mark.skip("CliRunner not working well in multi threaded app")
@@ -86,3 +92,13 @@ def test_cli_params_match_defaults():
         error_msg.append(f"Default keys missing from CLI params: {missing_from_cli}")
 
     assert not error_msg, "\n".join(error_msg)
+
+
+def test_fallback_model_is_next_model_from_same_provider():
+    openai_models = get_supported_openai_models()
+    chat_model = get_chat_model(openai_models[0], "openai-key", None, None, None, True)
+
+    assert get_provider(chat_model.name) == OPENAI
+    assert get_fallback_model(chat_model) == chat_model._replace(name=openai_models[1])
+    assert get_fallback_model(chat_model._replace(name=openai_models[-1])) is None
+    assert get_fallback_model(chat_model._replace(name="not-a-model")) is None